@@ -0,0 +1,209 @@
+from typing import Callable, Iterable, Iterator, Optional
+from afinn_loader import get_afinn
+from preprocessing import complete_tokenization, iter_tokenization, tokenize_paragraphs, PARAGRAPH_DELIMITER
+from scored_document import ScoredDocument
+from sentence_records import Sentence
+from sentiment_analysis import compute_all_sentences, get_sentence_score, score_sentences
+from sentiment_sentences import most_positive_sentence, most_negative_sentence
+from sliding_window_fixed import sliding_window
+from sliding_window_unfixed import sliding_window_2
+from spacing import smart_segment
+from worker_pool import tokenize_in_shards, PARALLEL_TOKENIZATION
+
+
+def prepare_text(content: str) -> str:
+    """
+    Apply word segmentation to text that contains no spaces at all.
+
+    Part of project requirements: strings with no spaces are treated as
+    run-together words and segmented with ``smart_segment``.
+
+    :param content: Raw document text.
+    :type content: str
+
+    :return: The text, segmented if it contained no spaces.
+    :rtype: str
+    """
+    if " " not in content.strip():
+        content = smart_segment(content)
+    return content
+
+
+def analyze_text(
+    content: str,
+    progress: Optional[Callable[[int, int, Sentence], None]] = None,
+    parallel: Optional[bool] = None
+) -> list[Sentence]:
+    """
+    Run the full analysis pipeline on a document.
+
+    Tokenizes the text and computes the sentiment score of every sentence.
+    Callers pass the text through ``prepare_text`` first.
+
+    :param content: Document text.
+    :type content: str
+
+    :param progress: Optional ``(processed, total, sentence)`` progress
+                     callback, passed on to ``complete_tokenization``.
+                     Each sentence is scored before it is handed over.
+    :type progress: Callable[[int, int, Sentence], None], optional
+
+    :param parallel: Shard long documents across the worker process pool
+                     with ``worker_pool.tokenize_in_shards``. Defaults to
+                     ``PARALLEL_TOKENIZATION``; pool workers pass ``False``.
+    :type parallel: bool, optional
+
+    :return: Sentence records as returned by ``compute_all_sentences``.
+    :rtype: list[Sentence]
+    """
+    if parallel is None:
+        parallel = PARALLEL_TOKENIZATION
+
+    if progress:
+        afinn = get_afinn()
+
+        # Score every sentence as it arrives, so the listener sees its score
+        def on_sentence(processed: int, total: int, sentence: Sentence) -> None:
+            sentence.score = get_sentence_score(afinn, sentence.tokens)
+            progress(processed, total, sentence)
+    else:
+        on_sentence = None
+
+    if parallel:
+        tokens = tokenize_in_shards(content, progress=on_sentence)
+    else:
+        tokens = complete_tokenization(content, progress=on_sentence)
+
+    # With a listener every sentence has been scored already
+    return tokens if progress else compute_all_sentences(tokens)
+
+
+def analyze_paragraphs(paragraphs: Iterable[str]) -> tuple[str, list[Sentence]]:
+    """
+    Analyse a document delivered as a stream of raw paragraphs.
+
+    Paragraphs are tokenized as they arrive, e.g. straight from
+    ``upload_reader.iter_upload_paragraphs``. The result is the same as
+    ``prepare_text`` followed by ``analyze_text`` on the joined text:
+    a document with two or more paragraphs always contains a space (the
+    delimiter has one), so only a single-paragraph document can need
+    segmentation. The first paragraph is therefore held back until a second
+    one arrives or the stream ends.
+
+    :param paragraphs: Raw paragraphs in document order.
+    :type paragraphs: Iterable[str]
+
+    :return: The prepared document text and its scored sentences.
+    :rtype: tuple[str, list[Sentence]]
+    """
+    received: list[str] = []
+
+    def prepared() -> Iterator[str]:
+        for paragraph in paragraphs:
+            received.append(paragraph)
+            if len(received) == 2:
+                yield received[0]
+            if len(received) >= 2:
+                yield paragraph
+        # Single paragraph: apply the no-space segmentation rule to it
+        if len(received) == 1:
+            received[0] = prepare_text(received[0])
+            yield received[0]
+
+    sentences = compute_all_sentences(tokenize_paragraphs(prepared()))
+    return PARAGRAPH_DELIMITER.join(received), sentences
+
+
+def iter_scored_sentences(content: str) -> Iterator[dict]:
+    """
+    Tokenize and score a document one sentence at a time.
+
+    A generator pipeline from sentence splitting through tokenization to
+    scoring: each sentence is yielded as soon as it is scored and its
+    record is not kept afterwards. Character cleaning and tagging work on
+    one paragraph at a time, so the first scores are ready once the first
+    paragraph is done; the document text itself is held throughout.
+    Callers pass the text through ``prepare_text`` first.
+
+    :param content: Document text.
+    :type content: str
+
+    :return: An iterator of ``{"para", "sentence", "score", "token_count"}``
+             dictionaries in document order.
+    :rtype: Iterator[dict]
+    """
+    for line in score_sentences(iter_tokenization(content)):
+        yield {
+            "para": line.para,
+            "sentence": line.sentence,
+            "score": line.score,
+            "token_count": len(line.tokens),
+        }
+
+
+def _extreme_to_json(result: tuple[float, str] | str) -> dict:
+    # sentiment_sentences returns (score, sentences) or an error message
+    if isinstance(result, tuple):
+        return {"score": result[0], "sentence": result[1]}
+    return {"message": result}
+
+
+def _fixed_window_to_json(result: list | str) -> dict:
+    # sliding_window returns [[sentences, score], [sentences, score]] or a message
+    if isinstance(result, str):
+        return {"message": result}
+    positive, negative = result
+    return {
+        "positive": {"segments": positive[0], "score": positive[1]},
+        "negative": {"segments": negative[0], "score": negative[1]},
+    }
+
+
+def _unfixed_window_to_json(result: list | str) -> dict:
+    # sliding_window_2 returns [max_segments, min_segments] or a message
+    if isinstance(result, str):
+        return {"message": result}
+    max_segments, min_segments = result
+    return {"positive": max_segments, "negative": min_segments}
+
+
+def summarize(sentences: list[Sentence], document: str, detail: bool = False) -> dict:
+    """
+    Build a JSON friendly summary of scored sentences.
+
+    Contains every sentence score, the most positive and negative sentences
+    and the results of both sliding windows. Analysis errors are reported
+    as ``{"message": ...}`` in place of the failed part, the same messages
+    the results page shows. This is where sentence records become
+    dictionaries. The analyses run on a ``ScoredDocument`` built once from
+    the records.
+
+    :param sentences: Output of ``compute_all_sentences``.
+    :type sentences: list[Sentence]
+
+    :param document: The text the sentences were tokenized from.
+    :type document: str
+
+    :param detail: Also include the span, original text and tokens of
+                   each sentence. Defaults to ``False``.
+    :type detail: bool, optional
+
+    :return: The summary dictionary.
+    :rtype: dict
+    """
+    if detail:
+        sentence_scores = [line.to_dict(document) for line in sentences]
+    else:
+        sentence_scores = [
+            {"para": line.para, "sentence": line.sentence, "score": line.score}
+            for line in sentences
+        ]
+
+    columns = ScoredDocument.from_sentences(sentences)
+    return {
+        "sentences": sentence_scores,
+        "most_positive": _extreme_to_json(most_positive_sentence(columns, document)),
+        "most_negative": _extreme_to_json(most_negative_sentence(columns, document)),
+        "sliding_window_fixed": _fixed_window_to_json(sliding_window(columns, document)),
+        "sliding_window_unfixed": _unfixed_window_to_json(sliding_window_2(columns, document)),
+    }
@@ -1,17 +1,42 @@
 import json
+import multiprocessing
+import os
 
-from flask import Flask, render_template, request, redirect, url_for
-from preprocessing import complete_tokenization
-from sentiment_analysis import compute_all_sentences
+from flask import Flask, render_template, request, redirect, url_for, send_file, jsonify, Response, abort
 from sentiment_sentences import most_positive_sentence, most_negative_sentence
-from chart import sentiment_gauge
+from chart import (sentiment_gauge, uses_local_plotlyjs, warm_gauge_cache, gauge_cache_stats,
+                   plotlyjs_path, plotlyjs_version)
 from sliding_window_fixed import sliding_window
 from sliding_window_unfixed import sliding_window_2
-import urllib.parse
-from spacing import smart_segment
+from analysis import prepare_text, analyze_text, analyze_paragraphs, summarize, iter_scored_sentences
+from upload_reader import iter_decoded_chunks, iter_upload_paragraphs, UploadTooLarge, MAX_UPLOAD_BYTES
+from result_store import ResultStore, document_key
+from scored_document import ScoredDocument
+from sentence_records import Document
+from worker_pool import analyze_documents, start_process_pool
+from jobs import JobManager, iter_job_events
+from lemma_table import lemma_table_stats
+from preprocessing import word_memo, sentence_cache
 
 app = Flask(__name__)
 
+# Precomputed results, looked up by the id carried in the /results redirect
+result_store = ResultStore()
+
+# Background analysis of large uploads, polled through /api/jobs/<id>
+job_manager = JobManager(result_store)
+
+# Startup work only runs in the serving process, not in pool workers that
+# re-import this module when they are spawned
+if multiprocessing.parent_process() is None:
+    # Optionally render every gauge at startup so requests only hit the cache
+    if os.environ.get("GAUGE_PREWARM") == "1":
+        warm_gauge_cache()
+
+    # Optionally start and warm the batch analysis workers at startup
+    if os.environ.get("ANALYSIS_POOL_PREWARM") == "1":
+        start_process_pool()
+
 @app.route("/", methods=["GET", "POST"])
 def index():
     """
@@ -21,9 +46,11 @@ def index():
         Displays the home page and upload form.
 
     **POST method**
-        Handles uploaded `.txt` files, performs segmentation if needed,
-        tokenizes and computes sentiment for each sentence, and redirects
-        to the results page.
+        Handles uploaded `.txt` files: decodes the upload incrementally,
+        tokenizes each paragraph as it is read (segmenting text without
+        spaces if needed), computes sentiment for each sentence, stores the
+        result under the document hash and redirects to the results page
+        with that id. Uploads larger than ``MAX_UPLOAD_BYTES`` are rejected.
 
     :return: Rendered `index.html` page or redirect to `/results`
     :rtype: flask.Response
@@ -40,25 +67,335 @@ def index():
         elif not file.filename.endswith(".txt"):
             message = "Please upload a .txt file!"
         else:
-            # Reading file content directly without saving locally
+            # Reading file content directly without saving locally.
+            # The stream is decoded chunk by chunk and every paragraph is
+            # tokenized as soon as it has been read.
             try:
-                content = file.read().decode("utf-8")
-                # Part of project requirements, checks strictly for strings with no spaces
-                if " " not in content.strip():
-                    content = smart_segment(content)
-
-                tokens = complete_tokenization(content)
-                sentences_dict = compute_all_sentences(tokens)
-                json_data = json.dumps(sentences_dict)
-                # Encode content for URL
-                encoded_content = urllib.parse.quote(content)
-                return redirect(url_for("results", json_data=json_data, file_content=encoded_content))
+                paragraphs = iter_upload_paragraphs(iter_decoded_chunks(file.stream, MAX_UPLOAD_BYTES))
+                # Segmentation of strings with no spaces (project requirement) happens in here
+                content, sentences_dict = analyze_paragraphs(paragraphs)
+
+                result_id = document_key(content)
+                if result_store.get_document(result_id) is None:
+                    result_store.put(result_id, Document(content, sentences_dict).to_dict())
+                return redirect(url_for("results", id=result_id))
+            except UploadTooLarge:
+                message = f"File is too large, the limit is {MAX_UPLOAD_BYTES // (1024 * 1024)} MB."
             # Added try except to handle decoding errors (tested with corrupt .txt file)
             except Exception:
                 message = "Error reading file. Make sure it's a valid text file."
 
     return render_template("index.html", message=message, content=content)
 
+
+def read_request_text() -> str:
+    """
+    Read and decode the raw request body.
+
+    The body is read through ``iter_decoded_chunks``, so it is held to the
+    same ``MAX_UPLOAD_BYTES`` limit as the upload form.
+
+    :return: The decoded request body
+    :rtype: str
+    :raises UploadTooLarge: If the body exceeds ``MAX_UPLOAD_BYTES``.
+    :raises UnicodeDecodeError: If the body is not valid UTF-8.
+    """
+    return "".join(iter_decoded_chunks(request.stream, MAX_UPLOAD_BYTES))
+
+
+def read_api_text() -> str:
+    """
+    Extract the document text from an API request.
+
+    Accepted bodies, checked in this order:
+        • multipart upload with a ``file`` field (a .txt file),
+        • JSON object with a ``text`` field,
+        • raw UTF-8 text as the request body.
+
+    Uploads and bodies are limited to ``MAX_UPLOAD_BYTES``, like the upload form.
+
+    :return: The decoded document text
+    :rtype: str
+    :raises UploadTooLarge: If the upload or body exceeds ``MAX_UPLOAD_BYTES``.
+    :raises ValueError: If the request carries no text or it is not valid UTF-8.
+    """
+    file = request.files.get("file")
+    if file and file.filename:
+        # Accept only .txt files, as the upload form does
+        if not file.filename.endswith(".txt"):
+            raise ValueError("Please upload a .txt file")
+        return "".join(iter_decoded_chunks(file.stream, MAX_UPLOAD_BYTES))
+
+    if request.is_json:
+        try:
+            payload = json.loads(read_request_text())
+        except json.JSONDecodeError:
+            payload = None
+        if not isinstance(payload, dict) or not isinstance(payload.get("text"), str):
+            raise ValueError("JSON body must be an object with a 'text' string")
+        return payload["text"]
+
+    text = read_request_text()
+    if not text.strip():
+        raise ValueError("Request body is empty")
+    return text
+
+
+@app.route("/api/analyze", methods=["POST"])
+def api_analyze():
+    """
+    JSON API for programmatic sentiment analysis.
+
+    Accepts raw text, a JSON ``{"text": ...}`` object or a .txt upload (see
+    ``read_api_text``), runs the same pipeline as the upload form and returns
+    sentence scores, the most positive/negative sentences and both sliding
+    window results. No charts are rendered.
+
+    :query detail: Set to ``1`` to include original text and tokens per sentence
+    :return: JSON summary, or ``{"error": ...}`` with status 400,
+             or 413 if the body exceeds ``MAX_UPLOAD_BYTES``
+    :rtype: flask.Response
+    """
+    try:
+        content = prepare_text(read_api_text())
+    except UploadTooLarge as e:
+        return jsonify({"error": str(e)}), 413
+    except (ValueError, UnicodeDecodeError) as e:
+        return jsonify({"error": str(e)}), 400
+
+    sentences = analyze_text(content)
+    return jsonify(summarize(sentences, content, detail=request.args.get("detail") == "1"))
+
+
+@app.route("/api/analyze/stream", methods=["POST"])
+def api_analyze_stream():
+    """
+    Stream per-sentence scores as NDJSON.
+
+    Accepts the same bodies as ``/api/analyze``. Each line of the response
+    is a ``{"para", "sentence", "score", "token_count"}`` object, written as
+    soon as that sentence is scored (see ``iter_scored_sentences``), so the
+    full list of sentences is never built on the server.
+
+    :return: ``application/x-ndjson`` stream, or ``{"error": ...}`` with status 400,
+             or 413 if the body exceeds ``MAX_UPLOAD_BYTES``
+    :rtype: flask.Response
+    """
+    try:
+        content = prepare_text(read_api_text())
+    except UploadTooLarge as e:
+        return jsonify({"error": str(e)}), 413
+    except (ValueError, UnicodeDecodeError) as e:
+        return jsonify({"error": str(e)}), 400
+
+    lines = (json.dumps(scored) + "\n" for scored in iter_scored_sentences(content))
+    return Response(lines, mimetype="application/x-ndjson")
+
+
+def parse_batch_documents(body: str, ndjson: bool) -> list[str]:
+    """
+    Parse the documents of a batch request.
+
+    Each document is either a JSON string or an object with a ``text``
+    string. The body is a JSON array of documents, or one document per line
+    when ``ndjson`` is set (blank lines are skipped).
+
+    :param body: Decoded request body
+    :type body: str
+    :param ndjson: Parse the body as newline delimited JSON
+    :type ndjson: bool
+    :return: The document texts in input order
+    :rtype: list[str]
+    :raises ValueError: If the body or one of the documents is malformed.
+    """
+    if ndjson:
+        items = [json.loads(line) for line in body.splitlines() if line.strip()]
+    else:
+        items = json.loads(body)
+        if not isinstance(items, list):
+            raise ValueError("JSON body must be an array of documents")
+
+    texts = []
+    for position, item in enumerate(items):
+        if isinstance(item, dict):
+            item = item.get("text")
+        if not isinstance(item, str):
+            raise ValueError(f"Document {position} must be a string or an object with a 'text' string")
+        texts.append(item)
+    return texts
+
+
+@app.route("/api/batch", methods=["POST"])
+def api_batch():
+    """
+    Analyse many documents in one request across the worker process pool.
+
+    The body is a JSON array of documents, or NDJSON (one document per
+    line) when sent as ``application/x-ndjson``. Results come back in input
+    order, as a JSON array for array input or streamed as NDJSON for NDJSON
+    input. Each result has the shape returned by ``/api/analyze``, or
+    ``{"error": ...}`` if that document failed.
+
+    :query chunk_size: Documents per worker task, defaults to ``ANALYSIS_CHUNK_SIZE``
+    :return: JSON array or NDJSON stream, or ``{"error": ...}`` with status 400,
+             or 413 if the body exceeds ``MAX_UPLOAD_BYTES``
+    :rtype: flask.Response
+    """
+    ndjson = request.mimetype in ("application/x-ndjson", "application/jsonl")
+    try:
+        texts = parse_batch_documents(read_request_text(), ndjson)
+        chunk_size = request.args.get("chunk_size", type=int)
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+    except UploadTooLarge as e:
+        return jsonify({"error": str(e)}), 413
+    except (ValueError, UnicodeDecodeError) as e:
+        return jsonify({"error": str(e)}), 400
+
+    results = analyze_documents(texts, chunk_size=chunk_size)
+    if ndjson:
+        # Send each result as soon as it (and all before it) are done
+        return Response((json.dumps(result) + "\n" for result in results),
+                        mimetype="application/x-ndjson")
+    return jsonify(list(results))
+
+
+@app.route("/api/jobs", methods=["POST"])
+def api_create_job():
+    """
+    Start an asynchronous analysis job.
+
+    Accepts the same bodies as ``/api/analyze`` and returns straight away
+    with status 202 and the job id, while the document is analysed by a
+    background worker. Poll ``/api/jobs/<id>`` for progress or follow
+    ``/api/jobs/<id>/events`` for a live stream.
+
+    :return: JSON ``{"id", "status_url", "events_url"}``, or ``{"error": ...}`` with status 400,
+             or 413 if the body exceeds ``MAX_UPLOAD_BYTES``
+    :rtype: flask.Response
+    """
+    try:
+        content = read_api_text()
+    except UploadTooLarge as e:
+        return jsonify({"error": str(e)}), 413
+    except (ValueError, UnicodeDecodeError) as e:
+        return jsonify({"error": str(e)}), 400
+
+    job = job_manager.submit(content)
+    status_url = url_for("api_job_status", job_id=job.id)
+    events_url = url_for("api_job_events", job_id=job.id)
+    return jsonify({"id": job.id, "status_url": status_url, "events_url": events_url}), 202, {"Location": status_url}
+
+
+@app.route("/api/jobs/<job_id>")
+def api_job_status(job_id):
+    """
+    Report the progress of an analysis job.
+
+    ``processed`` and ``total`` count sentences. Once the job is ``done``
+    the response also links to the JSON result and the HTML results page.
+
+    :param job_id: Id returned by ``/api/jobs``
+    :return: JSON job state, or ``{"error": ...}`` with status 404
+    :rtype: flask.Response
+    """
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown or expired job"}), 404
+
+    status = job.to_dict()
+    if job.status == "done":
+        status["result_url"] = url_for("api_job_result", job_id=job.id)
+        status["results_page"] = url_for("results", id=job.result_id)
+    return jsonify(status)
+
+
+@app.route("/api/jobs/<job_id>/events")
+def api_job_events(job_id):
+    """
+    Server-Sent Events stream of an analysis job.
+
+    Emits a ``sentence`` event with the partial score of every sentence as
+    it is produced, a ``paragraph`` event with progress and throughput when
+    a paragraph is finished, and ends with a ``done`` or ``failed`` event
+    (see ``iter_job_events``).
+
+    :param job_id: Id returned by ``/api/jobs``
+    :return: ``text/event-stream`` response, or ``{"error": ...}`` with status 404
+    :rtype: flask.Response
+    """
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown or expired job"}), 404
+
+    def stream():
+        for event, data in iter_job_events(job):
+            yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+    # Disable caching and proxy buffering so events arrive as they are sent
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    return Response(stream(), mimetype="text/event-stream", headers=headers)
+
+
+@app.route("/api/jobs/<job_id>/result")
+def api_job_result(job_id):
+    """
+    Serve the result of a finished analysis job.
+
+    :param job_id: Id returned by ``/api/jobs``
+    :return: The same JSON summary as ``/api/analyze``; status 409 while
+             the job is still running, 404 if the job or result is gone
+    :rtype: flask.Response
+    """
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({"error": "Unknown or expired job"}), 404
+    if job.status != "done":
+        return jsonify(job.to_dict()), 409
+
+    document = result_store.get_document(job.result_id)
+    if document is None:
+        return jsonify({"error": "Result expired"}), 404
+    return jsonify(summarize(document.sentences, document.text, detail=request.args.get("detail") == "1"))
+
+
+@app.route("/assets/plotly-<version>.min.js")
+def plotly_js(version):
+    """
+    Serve the plotly.js bundle referenced by the results page.
+
+    The bundle is sent from the installed plotly package with a long cache
+    lifetime. The version in the URL changes whenever plotly is upgraded,
+    so browsers download it once per version instead of once per chart.
+    Only the URL of the installed version is served, so a stale URL is never
+    cached with a newer bundle.
+
+    :param version: plotly.js version embedded in the asset URL
+    :return: The plotly.js file, or 404 if the version is not the installed one
+    :rtype: flask.Response
+    """
+    if version != plotlyjs_version():
+        abort(404)
+    return send_file(plotlyjs_path(), mimetype="text/javascript", max_age=365 * 24 * 60 * 60)
+
+
+@app.route("/stats")
+def stats():
+    """
+    Report hit/miss counters of the in-process caches as JSON.
+
+    :return: JSON object with one entry per cache
+    :rtype: flask.Response
+    """
+    return jsonify({
+        "gauge_cache": gauge_cache_stats(),
+        "result_store": result_store.memory.stats(),
+        "lemma_table": lemma_table_stats(),
+        "word_memo": word_memo.stats(),
+        "sentence_cache": sentence_cache.stats(),
+    })
+
+
 @app.route('/results')
 def results():
     """
@@ -70,16 +407,18 @@ def results():
 
     It also handles potential errors from any imported analysis functions.
 
-    :query json_data: JSON string containing tokenized sentences and scores
-    :query file_content: Encoded original text
+    :query id: Result id returned by ``document_key`` for the uploaded text
     :return: Rendered `results.html` template with sentiment data or error message
     :rtype: flask.Response
     """
-    json_data = request.args.get("json_data")
-    file_content = request.args.get("file_content", "")
-    # Decode content from URL
-    file_content = urllib.parse.unquote(file_content)
-    sentences_dict = json.loads(json_data)
+    document = result_store.get_document(request.args.get("id", ""))
+    if document is None:
+        message = "Result not found or expired. Please upload the file again."
+        return render_template("index.html", message=message, content=None), 404
+
+    file_content = document.text
+    # Columns are built once and shared by all the analyses below
+    columns = ScoredDocument.from_sentences(document.sentences)
 
     # Default values
     message_sentences_positive = ""
@@ -95,14 +434,14 @@ def results():
     pos_extract2 = neg_extract2 = ""
     pos_extract_fig2 = neg_extract_fig2 = ""
     try:
-        most_positive = most_positive_sentence(sentences_dict)
+        most_positive = most_positive_sentence(columns, file_content)
         pos_sentence = most_positive[1]
         pos_fig = sentiment_gauge(most_positive[0])
     except Exception:
         pos_sentence = most_positive
 
     try:
-        most_negative = most_negative_sentence(sentences_dict)
+        most_negative = most_negative_sentence(columns, file_content)
         neg_sentence = most_negative[1]
         neg_fig = sentiment_gauge(most_negative[0])
     except Exception:
@@ -110,7 +449,7 @@ def results():
 
     try:
         # Sliding window 1 (Fixed window size of 3)
-        sw_result = sliding_window(sentences_dict)
+        sw_result = sliding_window(columns, file_content)
         positive_para, negative_para = sw_result
         pos_extract = " ".join(positive_para[0])
         neg_extract = " ".join(negative_para[0])
@@ -122,7 +461,7 @@ def results():
 
     try:
         # Sliding window 2 (No fixed window)
-        sw2_result = sliding_window_2(sentences_dict)
+        sw2_result = sliding_window_2(columns, file_content)
         max_segments, min_segments = sw2_result
         most_positive_dict = max(max_segments, key=lambda d: len(d["sentence"])) if max_segments else {"sentence": "", "score": 0}
         most_negative_dict = max(min_segments, key=lambda d: len(d["sentence"])) if min_segments else {"sentence": "", "score": 0}
@@ -136,6 +475,7 @@ def results():
 
     return render_template(
         "results.html",
+        plotlyjs_url=url_for("plotly_js", version=plotlyjs_version()) if uses_local_plotlyjs() else None,
         message_sentences_positive=message_sentences_positive,
         message_sentences_negative=message_sentences_negative,
         message_sliding_1=message_sliding_1,
@@ -0,0 +1,70 @@
+"""
+Benchmark for ``preprocessing.convert_contractions``.
+
+Compares the word lookup engine with the previous approach, a single regex
+alternating over every key of ``CONTRACTION_MAP`` (longest first), on the
+sentences of a review corpus. Pass review ``.txt`` files to use them,
+otherwise a few built-in sentences are used. Sentences are lowercased and
+accent folded first, as in the pipeline. Run from the repository root:
+
+    python benchmarks/contractions.py [review.txt ...]
+"""
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from contractions import CONTRACTION_MAP
+from preprocessing import convert_accented_characters, convert_contractions, iter_sentences
+
+SAMPLE_TEXT = (
+    "I wasn't expecting much and the first hour is slow. It's the last act that makes it worth it.<br /><br />"
+    "The cast is great, the score is great, the script is not. You'll laugh, you'll cry, "
+    "and then you'll wonder why they didn't cut twenty minutes. Nothing here is new."
+)
+
+# Previous engine: ~120-way alternation scanned over every sentence
+CONTRACTION_PATTERN = re.compile(
+    r'(' + '|'.join(sorted(map(re.escape, CONTRACTION_MAP), key=len, reverse=True)) + r')'
+)
+
+# Repetitions per measurement
+NUMBER = 20
+
+
+def convert_with_regex(text: str) -> str:
+    return CONTRACTION_PATTERN.sub(lambda match: CONTRACTION_MAP[match.group(0)], text)
+
+
+def main() -> None:
+    texts = []
+    for path in sys.argv[1:]:
+        with open(path, encoding="utf-8") as f:
+            texts.append(f.read())
+
+    sentences = [convert_accented_characters(sentence.lower())
+                 for text in texts or [SAMPLE_TEXT] for _, _, sentence, _ in iter_sentences(text)]
+    with_apostrophe = sum(1 for sentence in sentences if "'" in sentence)
+
+    def run_regex():
+        return [convert_with_regex(sentence) for sentence in sentences]
+
+    def run_lookup():
+        return [convert_contractions(sentence) for sentence in sentences]
+
+    before = min(timeit.repeat(run_regex, number=NUMBER, repeat=3)) / (NUMBER * len(sentences))
+    after = min(timeit.repeat(run_lookup, number=NUMBER, repeat=3)) / (NUMBER * len(sentences))
+    differing = [(old, new) for old, new in zip(run_regex(), run_lookup()) if old != new]
+
+    print(f"sentences: {len(sentences)}, with an apostrophe: {with_apostrophe}")
+    print(f"regex:  {before * 1e6:8.2f} us per sentence")
+    print(f"lookup: {after * 1e6:8.2f} us per sentence ({before / after:.1f}x)")
+    print(f"different output: {len(differing)}")
+    for old, new in differing[:10]:
+        print(f"  regex:  {old!r}\n  lookup: {new!r}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Benchmark for ``preprocessing.remove_html_tags``.
+
+Compares the per-sentence cost of parsing every sentence with
+BeautifulSoup (the old behaviour) with the fast path, on sentences without
+markup, with simple tags and with complex markup that still needs the
+parser. Run from the repository root:
+
+    python benchmarks/html_strip.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bs4 import BeautifulSoup
+from preprocessing import remove_html_tags
+
+# Sentence mixes: reviews rarely contain markup once paragraphs are split
+SAMPLES = {
+    "plain": "this movie was not good at all, the acting felt wooden and the plot dragged on.",
+    "simple tags": "the ending was <i>absolutely</i> brilliant<br />and i loved the <b>score</b>.",
+    "complex markup": "a &quot;classic&quot; <!-- spoiler --> that isn't worth the hype &amp; money.",
+}
+
+# Repetitions per measurement
+NUMBER = 2000
+
+
+def parse_with_soup(text: str) -> str:
+    # Behaviour before the fast path: a full parse for every sentence
+    return BeautifulSoup(text, "html.parser").get_text()
+
+
+def main() -> None:
+    print(f"{'sentence':<16}{'soup (us)':>12}{'fast (us)':>12}{'speedup':>10}")
+    for name, sentence in SAMPLES.items():
+        assert remove_html_tags(sentence) == parse_with_soup(sentence)
+        before = min(timeit.repeat(lambda: parse_with_soup(sentence), number=NUMBER, repeat=3)) / NUMBER
+        after = min(timeit.repeat(lambda: remove_html_tags(sentence), number=NUMBER, repeat=3)) / NUMBER
+        print(f"{name:<16}{before * 1e6:>12.2f}{after * 1e6:>12.2f}{before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
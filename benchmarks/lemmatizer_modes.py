@@ -0,0 +1,97 @@
+"""
+Equivalence report for the ``"lexicon"`` and ``"none"`` lemmatizer modes.
+
+Shows where skipping lemmatization for words outside the lemma index, or
+the tagger-free ``"none"`` mode, changes a score compared with ``"full"``:
+
+    • Vocabulary: lists the words of ``UNIGRAM_FREQ_MAP`` that are neither
+      AFINN words nor in the index but still lemmatize onto an AFINN word
+      for some part of speech.
+    • Documents: lists the sentences that score differently in
+      ``"lexicon"`` or ``"none"`` mode than in ``"full"`` mode. Pass review ``.txt`` files to check them,
+      otherwise a few built-in sentences are used.
+
+Run from the repository root:
+
+    python benchmarks/lemmatizer_modes.py [review.txt ...]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from afinn_loader import get_afinn
+from lemma_index import LEMMA_POSITIONS, get_lemma_index
+from preprocessing import (LEMMATIZER_MODES, lemmatizer, ensure_alias_map, fold_sentence_tokens, iter_sentences,
+                           normalize_sentences, tokenize_normalized_sentences)
+from sentiment_analysis import get_sentence_score
+from unigram_freq import UNIGRAM_FREQ_MAP
+
+SAMPLE_TEXT = (
+    "The actors were loving every minute and it showed. The plot worsened as it went on.<br /><br />"
+    "Funniest film I have watched in years, the jokes never get tired. "
+    "Sadly the villains are the weakest part and the ending disappointed me."
+)
+
+
+def check_vocabulary() -> list[tuple[str, str, str]]:
+    # Words the index leaves out but that do reach an AFINN word
+    afinn = get_afinn()
+    index = get_lemma_index()
+    missed = []
+    for word in UNIGRAM_FREQ_MAP:
+        if word in afinn or word in index:
+            continue
+        for pos in LEMMA_POSITIONS:
+            lemma = lemmatizer.lemmatize(word, pos=pos)
+            if lemma in afinn:
+                missed.append((word, pos, lemma))
+    return missed
+
+
+def compare_documents(texts: list[str]) -> None:
+    afinn = get_afinn()
+    ensure_alias_map()
+    sentences = [sentence for text in texts for _, _, sentence, _ in iter_sentences(text)]
+    cleaned = normalize_sentences(sentences)
+
+    results = {}
+    for mode in LEMMATIZER_MODES:
+        start = time.perf_counter()
+        results[mode] = tokenize_normalized_sentences(cleaned, mode=mode)
+        print(f"{mode:<8} {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+    index = get_lemma_index()
+    tagged = sum(1 for clean_special in cleaned
+                 if any(word in index for word in fold_sentence_tokens(clean_special)[2]))
+    print(f"sentences: {len(sentences)}, still tagged in lexicon mode: {tagged}")
+
+    for mode in LEMMATIZER_MODES[1:]:
+        mismatches = [
+            (sentence, full_tokens, mode_tokens)
+            for sentence, full_tokens, mode_tokens in zip(sentences, results["full"], results[mode])
+            if get_sentence_score(afinn, full_tokens) != get_sentence_score(afinn, mode_tokens)
+        ]
+        print(f"score mismatches, {mode} vs full: {len(mismatches)}")
+        for sentence, full_tokens, mode_tokens in mismatches[:10]:
+            print(f"  {sentence!r}\n    full: {full_tokens}\n    {mode}: {mode_tokens}")
+
+
+def main() -> None:
+    print(f"lemma index: {len(get_lemma_index())} forms")
+
+    missed = check_vocabulary()
+    print(f"vocabulary: {len(UNIGRAM_FREQ_MAP)} words, missed by the index: {len(missed)}")
+    for word, pos, lemma in missed[:10]:
+        print(f"  {word} ({pos}) -> {lemma}")
+
+    texts = []
+    for path in sys.argv[1:]:
+        with open(path, encoding="utf-8") as f:
+            texts.append(f.read())
+    compare_documents(texts or [SAMPLE_TEXT])
+
+
+if __name__ == "__main__":
+    main()
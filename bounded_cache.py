@@ -0,0 +1,128 @@
+from collections import OrderedDict
+from typing import Any, Hashable
+import threading
+
+
+class BoundedCache:
+    """
+    Thread-safe least-recently-used mapping with a fixed capacity.
+
+    Entries are kept in an ``OrderedDict`` ordered from least to most
+    recently used. Once ``maxsize`` entries are stored, inserting a new key
+    evicts the least recently used one. Hits, misses and evictions are
+    counted so callers can size the cache from real traffic.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        """
+        :param maxsize: Maximum number of entries kept in memory. A value of
+                        ``0`` disables caching entirely.
+        :type maxsize: int
+        """
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Look up a key and mark it as most recently used.
+
+        :param key: The cache key.
+        :type key: Hashable
+
+        :param default: Value returned when the key is not cached.
+        :type default: Any, optional
+
+        :return: The cached value, or ``default`` on a miss.
+        :rtype: Any
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry when full.
+
+        :param key: The cache key.
+        :type key: Hashable
+
+        :param value: The value to store.
+        :type value: Any
+
+        :return: None
+        :rtype: None
+        """
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            # Drop the oldest entries until we are back within capacity
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Remove a key from the cache without touching the counters.
+
+        :param key: The cache key.
+        :type key: Hashable
+
+        :param default: Value returned when the key is not cached.
+        :type default: Any, optional
+
+        :return: The removed value, or ``default``.
+        :rtype: Any
+        """
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self) -> None:
+        """
+        Remove every entry and reset the counters.
+
+        :return: None
+        :rtype: None
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, int | float]:
+        """
+        Report the current size and hit/miss/eviction counters.
+
+        :return: A dictionary with ``size``, ``maxsize``, ``hits``,
+                 ``misses``, ``evictions`` and ``hit_rate``.
+        :rtype: dict[str, int | float]
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
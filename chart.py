@@ -1,22 +1,108 @@
-import plotly.graph_objs as go
-import plotly.io as pio
-    
+import math
+import os
+import uuid
+from functools import lru_cache
+from typing import Callable
+from bounded_cache import BoundedCache
+
+# Which renderer draws the gauges:
+#   "plotly" - interactive Plotly indicator (imports plotly on first use)
+#   "svg"    - static inline SVG computed with plain math, no plotly import
+GAUGE_BACKEND = os.environ.get("GAUGE_BACKEND", "plotly")
+
+# How the plotly.js bundle reaches the browser:
+#   "local"  - charts contain only their div and spec, the page loads
+#              plotlyjs_path() once through the /assets route in app.py
+#   "inline" - every chart embeds the full multi-megabyte bundle
+PLOTLYJS_MODE = os.environ.get("PLOTLYJS_MODE", "local")
+
+# Scores are rounded to this step before rendering, so close scores share one
+# cached gauge. 0.001 gives 2001 distinct gauges across the -1..1 axis.
+GAUGE_QUANTUM = float(os.environ.get("GAUGE_QUANTUM", "0.001"))
+
+# Maximum number of rendered gauges kept in memory
+GAUGE_CACHE_SIZE = int(os.environ.get("GAUGE_CACHE_SIZE", "4096"))
+
+# Cached gauges are rendered with this div id, replaced by a fresh id on every
+# use so two identical gauges on one page do not share a div
+_DIV_ID_PLACEHOLDER = "sentiment-gauge-div-id"
+
+_gauge_cache = BoundedCache(GAUGE_CACHE_SIZE)
+
+
 """
     Generates an HTML representation of a gauge chart for sentiment analysis.
 
-    This function creates a Plotly gauge chart visualizing a sentiment score.
+    This function creates a gauge chart visualizing a sentiment score.
     The chart displays the score on an axis ranging from -1 (negative) to 1 (positive)
     and includes a corresponding emoji at the center. The output is a raw HTML string
-    of the Plotly figure, suitable for embedding.
+    suitable for embedding, drawn by the renderer selected with ``GAUGE_BACKEND``.
+
+    Unless ``include_plotlyjs`` says otherwise, ``PLOTLYJS_MODE`` decides
+    whether the plotly.js bundle is inlined or left for the page to load once.
+
+    The score is quantized to ``GAUGE_QUANTUM`` and the rendered HTML is
+    cached, so only the first request for a given score pays for the figure.
 
     :param score: The sentiment score to display, expected to be between -1 and 1.
     :type score: float
-    :return: A string containing the HTML representation of the Plotly gauge chart.
+    :param include_plotlyjs: Inline the plotly.js bundle in the output.
+                             Defaults to ``PLOTLYJS_MODE == "inline"``.
+                             Ignored by the SVG backend.
+    :type include_plotlyjs: bool, optional
+    :return: A string containing the HTML representation of the gauge chart.
     :rtype: str
 """
-def sentiment_gauge(score):
+def sentiment_gauge(score, include_plotlyjs=None):
+    if include_plotlyjs is None:
+        include_plotlyjs = PLOTLYJS_MODE == "inline"
+
+    # Emoji follows the exact score, rounding must not flip it around zero
     emoji = "😊" if score >= 0 else "😡"
-    
+    key = (GAUGE_BACKEND, quantize_score(score), emoji, include_plotlyjs)
+
+    html = _gauge_cache.get(key)
+    if html is None:
+        html = GAUGE_RENDERERS[GAUGE_BACKEND](key[1], emoji, include_plotlyjs)
+        _gauge_cache.put(key, html)
+
+    return html.replace(_DIV_ID_PLACEHOLDER, str(uuid.uuid4()))
+
+
+def quantize_score(score: float) -> float:
+    """
+    Round a score to the nearest multiple of ``GAUGE_QUANTUM``.
+
+    :param score: The sentiment score to quantize.
+    :type score: float
+    :return: The quantized score.
+    :rtype: float
+    """
+    steps = round(score / GAUGE_QUANTUM)
+    # Round again to drop float noise such as 0.30000000000000004
+    return round(steps * GAUGE_QUANTUM, 10)
+
+
+def _render_plotly_gauge(score: float, emoji: str, include_plotlyjs: bool) -> str:
+    """
+    Build the Plotly gauge figure and render it to HTML.
+
+    The figure div uses ``_DIV_ID_PLACEHOLDER`` as its id so the output can
+    be cached and given a unique id per use.
+
+    :param score: The (quantized) score to display.
+    :type score: float
+    :param emoji: Emoji shown in the centre of the gauge.
+    :type emoji: str
+    :param include_plotlyjs: Inline the plotly.js bundle in the output.
+    :type include_plotlyjs: bool
+    :return: The HTML of the gauge.
+    :rtype: str
+    """
+    # Imported here so processes using the SVG backend never load plotly
+    import plotly.graph_objs as go
+    import plotly.io as pio
+
     fig = go.Figure(go.Indicator(
         mode="gauge",
         gauge={
@@ -51,4 +137,154 @@ def sentiment_gauge(score):
         'modeBarButtonsToRemove': ['sendDataToCloud']
     }
 
-    return pio.to_html(fig, full_html=False, config=config)
\ No newline at end of file
+    return pio.to_html(fig, full_html=False, config=config,
+                       include_plotlyjs=include_plotlyjs, div_id=_DIV_ID_PLACEHOLDER)
+
+
+def _gauge_point(value: float, radius: float) -> tuple[float, float]:
+    """
+    Map a value on the -1..1 axis to a point on the gauge arc.
+
+    -1 sits on the left end of the half circle, 1 on the right end and 0
+    at the top. The y axis points down as in SVG.
+
+    :param value: Position on the axis, clamped to -1..1.
+    :type value: float
+    :param radius: Distance from the gauge centre.
+    :type radius: float
+    :return: The ``(x, y)`` point in SVG coordinates.
+    :rtype: tuple[float, float]
+    """
+    value = max(-1.0, min(1.0, value))
+    angle = math.pi * (1 - (value + 1) / 2)
+    return (round(150 + radius * math.cos(angle), 2),
+            round(180 - radius * math.sin(angle), 2))
+
+
+def _render_svg_gauge(score: float, emoji: str, include_plotlyjs: bool) -> str:
+    """
+    Render the gauge as a small inline SVG.
+
+    Draws the same -1..1 half circle as the Plotly backend: a grey track,
+    a bar filled from -1 up to the score, tick labels at -1, 0 and 1, the
+    title and the emoji in the centre. ``include_plotlyjs`` is accepted for
+    a uniform renderer signature and ignored.
+
+    :param score: The (quantized) score to display.
+    :type score: float
+    :param emoji: Emoji shown in the centre of the gauge.
+    :type emoji: str
+    :param include_plotlyjs: Unused.
+    :type include_plotlyjs: bool
+    :return: The HTML of the gauge.
+    :rtype: str
+    """
+    radius = 110
+    left = _gauge_point(-1, radius)
+    right = _gauge_point(1, radius)
+    value = _gauge_point(score, radius)
+
+    track = f"M {left[0]} {left[1]} A {radius} {radius} 0 0 1 {right[0]} {right[1]}"
+    bar = f"M {left[0]} {left[1]} A {radius} {radius} 0 0 1 {value[0]} {value[1]}"
+
+    # Tick labels just outside the arc
+    labels = "".join(
+        f'<text x="{x}" y="{y}" text-anchor="middle" font-size="14">{tick}</text>'
+        for tick, (x, y) in ((tick, _gauge_point(tick, radius + 30)) for tick in (-1, 0, 1))
+    )
+
+    return (
+        f'<div id="{_DIV_ID_PLACEHOLDER}" class="sentiment-gauge">'
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 300 210" width="450" height="300" '
+        f'role="img" aria-label="Sentiment score {score}">'
+        f'<text x="150" y="22" text-anchor="middle" font-size="18">Sentiment Analysis</text>'
+        f'<path d="{track}" fill="none" stroke="#eeeeee" stroke-width="30"/>'
+        f'<path d="{bar}" fill="none" stroke="#636efa" stroke-width="20"/>'
+        f'{labels}'
+        f'<text x="150" y="175" text-anchor="middle" font-size="60">{emoji}</text>'
+        f'</svg></div>'
+    )
+
+
+# Available gauge renderers, selected by GAUGE_BACKEND. Each takes the
+# quantized score, the emoji and the include_plotlyjs flag and returns HTML.
+GAUGE_RENDERERS: dict[str, Callable[[float, str, bool], str]] = {
+    "plotly": _render_plotly_gauge,
+    "svg": _render_svg_gauge,
+}
+
+if GAUGE_BACKEND not in GAUGE_RENDERERS:
+    raise ValueError(f"[chart] Unknown GAUGE_BACKEND {GAUGE_BACKEND!r}, expected one of {sorted(GAUGE_RENDERERS)}")
+
+
+def warm_gauge_cache(lower: float = -1.0, upper: float = 1.0) -> int:
+    """
+    Pre-render every quantized gauge between ``lower`` and ``upper``.
+
+    Meant to run once at startup so the first requests do not pay for
+    rendering. Both emojis are rendered for zero, the point where they switch.
+
+    :param lower: Lowest score to render. Defaults to -1.
+    :type lower: float
+    :param upper: Highest score to render. Defaults to 1.
+    :type upper: float
+    :return: Number of gauges rendered.
+    :rtype: int
+    """
+    include_plotlyjs = PLOTLYJS_MODE == "inline"
+    render = GAUGE_RENDERERS[GAUGE_BACKEND]
+    rendered = 0
+    for step in range(round(lower / GAUGE_QUANTUM), round(upper / GAUGE_QUANTUM) + 1):
+        score = round(step * GAUGE_QUANTUM, 10)
+        emojis = ("😊", "😡") if step == 0 else ("😊" if score > 0 else "😡",)
+        for emoji in emojis:
+            key = (GAUGE_BACKEND, score, emoji, include_plotlyjs)
+            if key not in _gauge_cache:
+                _gauge_cache.put(key, render(score, emoji, include_plotlyjs))
+                rendered += 1
+    return rendered
+
+
+def gauge_cache_stats() -> dict[str, int | float]:
+    """
+    Report size and hit/miss counters of the gauge render cache.
+
+    :return: The ``BoundedCache.stats`` of the gauge cache.
+    :rtype: dict[str, int | float]
+    """
+    return _gauge_cache.stats()
+
+
+def uses_local_plotlyjs() -> bool:
+    """
+    Check whether pages have to load the shared plotly.js asset themselves.
+
+    :return: ``True`` when Plotly gauges are rendered without the inline bundle.
+    :rtype: bool
+    """
+    return GAUGE_BACKEND == "plotly" and PLOTLYJS_MODE != "inline"
+
+
+@lru_cache(maxsize=1)
+def plotlyjs_path() -> str:
+    """
+    Locate the plotly.js bundle shipped with the installed plotly package.
+
+    :return: Absolute path of ``plotly.min.js``.
+    :rtype: str
+    """
+    import plotly
+    return os.path.join(os.path.dirname(plotly.__file__), "package_data", "plotly.min.js")
+
+
+@lru_cache(maxsize=1)
+def plotlyjs_version() -> str:
+    """
+    Version of the bundled plotly.js, used in the asset URL so browsers can
+    cache it forever.
+
+    :return: The plotly.js version string.
+    :rtype: str
+    """
+    from plotly.offline import get_plotlyjs_version
+    return get_plotlyjs_version()
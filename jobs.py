@@ -0,0 +1,223 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional
+import os
+import threading
+import time
+import uuid
+from analysis import prepare_text, analyze_text
+from result_store import ResultStore, document_key
+from sentence_records import Document, Sentence
+
+# Number of background threads running analysis jobs
+JOB_WORKERS = int(os.environ.get("JOB_WORKERS", "2"))
+
+# Finished jobs are forgotten after this many seconds (their results stay
+# in the result store until its own TTL expires)
+JOB_TTL_SECONDS = 60 * 60
+
+# Seconds between keep-alive events on an idle progress stream
+EVENT_KEEPALIVE_SECONDS = 15
+
+
+class Job:
+    """
+    State of one background analysis job.
+
+    ``status`` moves from ``"queued"`` to ``"running"`` and ends as
+    ``"done"`` or ``"failed"``. ``processed`` and ``total`` count sentences
+    and are updated while the document is tokenized. ``scores`` collects
+    the partial ``{"para", "sentence", "score"}`` results in the order they
+    are produced; ``changed`` is notified whenever one is added or the job
+    finishes.
+    """
+
+    def __init__(self):
+        self.id = uuid.uuid4().hex
+        self.status = "queued"
+        self.processed = 0
+        self.total = 0
+        self.scores: list[dict] = []
+        self.result_id: Optional[str] = None
+        self.error: Optional[str] = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.changed = threading.Condition()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("done", "failed")
+
+    def to_dict(self) -> dict:
+        """
+        Snapshot of the job state for the status endpoint.
+
+        :return: The job fields as a JSON friendly dictionary.
+        :rtype: dict
+        """
+        return {
+            "id": self.id,
+            "status": self.status,
+            "processed": self.processed,
+            "total": self.total,
+            "result_id": self.result_id,
+            "error": self.error,
+        }
+
+
+class JobManager:
+    """
+    Runs document analysis in a background thread pool.
+
+    Submitting returns immediately with a job id, so request threads are
+    not blocked for the duration of tokenization. Finished results are put
+    in the shared ``ResultStore`` under the document hash, the same place
+    the upload form stores them.
+    """
+
+    def __init__(self, result_store: ResultStore, workers: int = JOB_WORKERS):
+        """
+        :param result_store: Store receiving the finished results.
+        :type result_store: ResultStore
+
+        :param workers: Number of background threads.
+        :type workers: int
+        """
+        self.result_store = result_store
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="analysis-job")
+        self._jobs: dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, content: str) -> Job:
+        """
+        Queue a document for analysis.
+
+        :param content: Raw document text.
+        :type content: str
+
+        :return: The new job.
+        :rtype: Job
+        """
+        job = Job()
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+        self._executor.submit(self._run, job, content)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """
+        Look up a job by id.
+
+        :param job_id: Id returned by ``submit``.
+        :type job_id: str
+
+        :return: The job, or ``None`` if it is unknown or expired.
+        :rtype: Job | None
+        """
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _run(self, job: Job, content: str) -> None:
+        # Executed in a pool thread; every outcome ends in a final status
+        job.status = "running"
+        job.started_at = time.time()
+        try:
+            content = prepare_text(content)
+            result_id = document_key(content)
+
+            # Already analysed documents finish straight away
+            document = self.result_store.get_document(result_id)
+            if document is None:
+                # analyze_text hands over every sentence already scored
+                def progress(processed: int, total: int, sentence: Sentence) -> None:
+                    partial = {"para": sentence.para, "sentence": sentence.sentence, "score": sentence.score}
+                    with job.changed:
+                        job.processed, job.total = processed, total
+                        job.scores.append(partial)
+                        job.changed.notify_all()
+
+                sentences = analyze_text(content, progress=progress)
+                self.result_store.put(result_id, Document(content, sentences).to_dict())
+            else:
+                job.scores = [{"para": line.para, "sentence": line.sentence, "score": line.score}
+                              for line in document.sentences]
+                job.processed = job.total = len(document.sentences)
+
+            job.result_id = result_id
+            job.status = "done"
+        except Exception as e:
+            job.error = f"{type(e).__name__}: {e}"
+            job.status = "failed"
+        finally:
+            with job.changed:
+                job.finished_at = time.time()
+                job.changed.notify_all()
+
+    def _prune(self) -> None:
+        # Drop finished jobs past their TTL; caller holds the lock
+        cutoff = time.time() - JOB_TTL_SECONDS
+        expired = [job_id for job_id, job in self._jobs.items()
+                   if job.finished_at is not None and job.finished_at < cutoff]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+
+def iter_job_events(job: Job) -> Iterator[tuple[str, dict]]:
+    """
+    Follow a job and yield its progress as ``(event, data)`` pairs.
+
+    Events, in order of production:
+        • ``"sentence"``: a sentence was scored, with its ``para``,
+          ``sentence`` and ``score`` plus ``processed``/``total`` counts.
+        • ``"paragraph"``: every sentence of a paragraph is scored, with the
+          paragraph number, its sentence count, the progress counts and the
+          throughput so far in sentences per second.
+        • ``"keepalive"``: nothing happened for ``EVENT_KEEPALIVE_SECONDS``.
+        • ``"done"`` or ``"failed"``: the final job state; always the last
+          event.
+
+    Sentences scored before the stream was opened are replayed first, so
+    a client connecting late still receives every partial result.
+
+    :param job: The job to follow.
+    :type job: Job
+
+    :return: An iterator of event names and JSON friendly payloads.
+    :rtype: Iterator[tuple[str, dict]]
+    """
+    cursor = 0
+    current_para = None
+    para_sentences = 0
+
+    def paragraph_event() -> tuple[str, dict]:
+        elapsed = max(time.time() - (job.started_at or time.time()), 1e-9)
+        return "paragraph", {"para": current_para, "sentences": para_sentences,
+                             "processed": cursor, "total": job.total,
+                             "sentences_per_second": round(cursor / elapsed, 2)}
+
+    while True:
+        with job.changed:
+            if cursor == len(job.scores) and not job.finished:
+                job.changed.wait(EVENT_KEEPALIVE_SECONDS)
+            new_scores = job.scores[cursor:]
+            finished = job.finished
+
+        if not new_scores and not finished:
+            yield "keepalive", {"processed": job.processed, "total": job.total}
+            continue
+
+        for partial in new_scores:
+            # A new paragraph number means the previous one is complete
+            if current_para is not None and partial["para"] != current_para:
+                yield paragraph_event()
+                para_sentences = 0
+            current_para = partial["para"]
+            para_sentences += 1
+            cursor += 1
+            yield "sentence", {**partial, "processed": cursor, "total": job.total}
+
+        if finished:
+            if current_para is not None and job.status == "done":
+                yield paragraph_event()
+            yield job.status, job.to_dict()
+            return
@@ -0,0 +1,348 @@
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable
+import os
+import re
+import threading
+from nltk.corpus import wordnet
+from nltk.stem import WordNetLemmatizer
+from afinn_loader import get_afinn
+from unigram_freq import UNIGRAM_FREQ_MAP
+
+# Compiled inflection lexicon: one "surface form<TAB>AFINN word" line per form.
+# Built once from WordNet, see save_inflected_lexicon()
+INFLECTED_LEXICON_PATH = Path(__file__).resolve().parent / "afinn_inflections.tsv"
+
+# Used in get_inflected_lexicon()
+_lock = threading.Lock()
+
+# WordNet parts of speech the lemmatizer is called with (see get_wordnet_position).
+# Spelled out so importing this module does not load the WordNet corpus.
+LEMMA_POSITIONS = ("n", "v", "a", "r")
+
+# Adjective endings of two-syllable words that still take -er/-est ("simpler", "narrower")
+SHORT_ADJECTIVE_ENDINGS = ("le", "ow")
+
+# Verbs whose past tense is the verb itself, WordNet has no exception for them
+UNCHANGED_PAST_VERBS = frozenset({
+    "bet", "bid", "broadcast", "burst", "cast", "cost", "cut", "forecast", "hit", "hurt", "let",
+    "miscast", "misread", "put", "quit", "read", "rid", "set", "shed", "shut", "slit", "split",
+    "spread", "thrust", "upset",
+})
+
+# One-syllable verbs that double their final consonant ("stop" -> "stopped")
+single_vowel_consonant = re.compile(r"[^aeiou]*[aeiou][^aeiouwxy]")
+
+
+def is_adjective_entry(word: str) -> bool:
+    """
+    Check whether a lexicon word is mainly used as an adjective.
+
+    True when most of its WordNet senses are adjective senses and it is
+    not a participle or another verb form (``"lost"``, ``"abandoned"``).
+    Needs the WordNet corpus.
+
+    :param word: Lowercase lexicon word.
+    :type word: str
+
+    :return: ``True`` for adjective entries.
+    :rtype: bool
+    """
+    if word.endswith(("ed", "ing")) or word in wordnet._exception_map["v"]:
+        return False
+
+    senses = {pos: len(offsets) for pos, offsets in wordnet._lemma_pos_offset_map.get(word, {}).items()}
+    adjective_senses = senses.get("a", 0) + senses.get("s", 0)
+    return adjective_senses > 0 and adjective_senses >= senses.get("n", 0) + senses.get("v", 0)
+
+
+def comparative_forms(adjective: str) -> tuple[str, ...]:
+    """
+    Regular comparative and superlative of an adjective.
+
+    Only short adjectives take -er/-est; longer words are compared with
+    "more" and "most" and get no forms. Adjectives ending in ``e`` add
+    ``-r``/``-st`` (``"loose" -> "looser"``). A consonant followed by
+    ``y`` becomes ``-ier``/``-iest`` and a doubled final consonant
+    (``"sadder"``) needs no rule, WordNet lists both as exceptions.
+
+    :param adjective: Lowercase adjective entry, see ``is_adjective_entry``.
+    :type adjective: str
+
+    :return: The comparative and superlative, or ``()`` if the adjective
+             is not compared with suffixes.
+    :rtype: tuple[str, ...]
+    """
+    # Plural-looking entries ("nuts", "tops") and -ier/-iest adjectives
+    if (adjective.endswith("s") and not adjective.endswith("ss")) or \
+            (adjective.endswith("y") and adjective[-2:-1] not in "aeiou"):
+        return ()
+
+    syllables = len(re.findall(r"[aeiou]+", adjective))
+    # A final "e" is silent, except in "-le" and "-ee"
+    if adjective.endswith("e") and not adjective.endswith(("le", "ee")) and syllables > 1:
+        syllables -= 1
+    if syllables > 2 or (syllables == 2 and not adjective.endswith(SHORT_ADJECTIVE_ENDINGS)):
+        return ()
+
+    stem = adjective[:-1] if adjective.endswith("e") else adjective
+    return (stem + "er", stem + "est")
+
+
+def s_form(word: str) -> str:
+    """
+    Regular plural of a noun or third person singular of a verb.
+
+    :param word: Lowercase noun or verb.
+    :type word: str
+
+    :return: ``"-es"`` after a sibilant, ``"-ies"`` for a consonant
+             followed by ``y``, ``"-s"`` otherwise.
+    :rtype: str
+    """
+    if word.endswith(("s", "x", "z", "ch", "sh")):
+        return word + "es"
+    if word.endswith("y") and word[-2:-1] not in "aeiou":
+        return word[:-1] + "ies"
+    return word + "s"
+
+
+def verb_forms(verb: str) -> dict[str, str]:
+    """
+    Regular inflected forms of a verb, by inflection.
+
+    One-syllable verbs ending in a single vowel and consonant double it
+    (``"scam" -> "scammed"``). Longer verbs that double (``"abhorred"``)
+    and strong verbs (``"forgave"``) are listed as WordNet exceptions
+    instead, see ``build_lemma_index``. Verbs in ``UNCHANGED_PAST_VERBS``
+    have no -ed form.
+
+    :param verb: Lowercase verb.
+    :type verb: str
+
+    :return: The ``"s"``, ``"ed"`` and ``"ing"`` forms.
+    :rtype: dict[str, str]
+    """
+    stem = verb + verb[-1] if single_vowel_consonant.fullmatch(verb) else verb
+
+    if verb.endswith("e"):
+        past = verb + "d"
+    elif verb.endswith("y") and verb[-2:-1] not in "aeiou":
+        past = verb[:-1] + "ied"
+    else:
+        past = stem + "ed"
+
+    if verb.endswith("ie"):
+        gerund = verb[:-2] + "ying"
+    elif verb.endswith("e") and not verb.endswith(("ee", "oe", "ye")):
+        gerund = verb[:-1] + "ing"
+    else:
+        gerund = stem + "ing"
+
+    forms = {"s": s_form(verb), "ed": past, "ing": gerund}
+    if verb in UNCHANGED_PAST_VERBS:
+        del forms["ed"]
+    return forms
+
+
+def is_base_form(word: str) -> bool:
+    """
+    Check that a lexicon word is not itself an inflected form.
+
+    Entries such as ``"thanks"`` or ``"losses"`` lemmatize to a shorter
+    word and take no further inflections. Needs the WordNet corpus.
+
+    :param word: Lowercase lexicon word.
+    :type word: str
+
+    :return: ``True`` if neither the noun nor the verb rules change the word.
+    :rtype: bool
+    """
+    return all(wordnet._morphy(word, pos) in ([], [word]) for pos in ("n", "v"))
+
+
+def irregular_inflection(form: str) -> str:
+    """
+    Which regular verb form an irregular one from WordNet stands in for.
+
+    :param form: Form from the WordNet verb exception list.
+    :type form: str
+
+    :return: A key of ``verb_forms``.
+    :rtype: str
+    """
+    if form.endswith("ing"):
+        return "ing"
+    return "s" if form.endswith("s") and not form.endswith("ss") else "ed"
+
+
+def build_lemma_index(lexicon_words: Iterable[str]) -> frozenset[str]:
+    """
+    Build the set of surface forms that can lemmatize onto a lexicon word.
+
+    The forms are the real inflections of every lexicon word: the WordNet
+    exception lists (``"worse" -> "bad"``, ``"abhorred" -> "abhor"``),
+    the ``verb_forms`` of verbs and the ``comparative_forms`` of adjective
+    entries. Inverting WordNet's suffix rules instead would give non-words
+    such as ``"abandones"``.
+
+    A regular verb form is left out when the exception list already has an
+    irregular one for the same inflection (no ``"abhored"`` next to
+    ``"abhorred"``). Whether a noun takes a plural (``"annoyances"`` but
+    not ``"filths"``) cannot be told from WordNet, so noun plurals are only
+    added when they are in the unigram vocabulary; the same goes for
+    regular verb forms next to an irregular one (``"canceled"`` next to
+    ``"cancelled"``). No comparatives are added for adjectives with
+    irregular forms (``"good"``, ``"big"``).
+
+    The lexicon words themselves are left out, they are never lemmatized.
+
+    :param lexicon_words: Single-word lexicon entries, e.g. AFINN keys.
+    :type lexicon_words: Iterable[str]
+
+    :return: The surface forms worth lemmatizing.
+    :rtype: frozenset[str]
+    """
+    lexicon = set(lexicon_words)
+    index = set()
+
+    for pos in LEMMA_POSITIONS:
+        exceptions = wordnet._exception_map[pos]
+        # Irregular forms, e.g. "better" lists "good" and "well" as bases
+        for form, bases in exceptions.items():
+            if any(base in lexicon for base in bases):
+                index.add(form)
+
+        # Regular comparatives and superlatives, e.g. "loose" -> "looser", "loosest"
+        if pos == "a":
+            irregular = set(exceptions)
+            irregular.update(base for bases in exceptions.values() for base in bases)
+            for word in lexicon - irregular:
+                if is_adjective_entry(word):
+                    index.update(comparative_forms(word))
+            continue
+
+        # Adverbs are not inflected
+        if pos == "r":
+            continue
+
+        # Inflections a verb has irregular forms for, e.g. "abhor": {"ed", "ing"}
+        irregular = {}
+        for form, bases in exceptions.items():
+            for base in bases:
+                irregular.setdefault(base, set()).add(irregular_inflection(form))
+
+        for word in lexicon:
+            if pos not in wordnet._lemma_pos_offset_map.get(word, {}):
+                continue
+            if pos == "n":
+                plural = word[:-3] + "men" if word.endswith("man") else s_form(word)
+                if plural in UNIGRAM_FREQ_MAP:
+                    index.add(plural)
+                continue
+            if not is_base_form(word):
+                continue
+
+            index.update(form for inflection, form in verb_forms(word).items()
+                         if inflection not in irregular.get(word, ()) or form in UNIGRAM_FREQ_MAP)
+
+    return frozenset(index - lexicon)
+
+
+# Built once per process, the AFINN lexicon does not change while running
+@lru_cache(maxsize=1)
+def get_lemma_index() -> frozenset[str]:
+    """
+    Return the surface forms that lemmatize onto a single-word AFINN entry.
+
+    These are exactly the forms of the compiled inflection lexicon (the
+    forms of ``build_lemma_index`` that really reach an AFINN word for at
+    least one part of speech), so loading the index needs no WordNet.
+
+    :return: Surface forms that can lemmatize onto an AFINN word.
+    :rtype: frozenset[str]
+    """
+    return frozenset(get_inflected_lexicon())
+
+
+def build_inflected_lexicon(lexicon_words: Iterable[str]) -> dict[str, str]:
+    """
+    Map inflected forms of lexicon words onto the lexicon word.
+
+    Every form from ``build_lemma_index`` is lemmatized as a noun, verb,
+    adjective and adverb (in ``LEMMA_POSITIONS`` order) and mapped to the
+    first lemma that is a lexicon word, e.g. ``"worst" -> "bad"`` or
+    ``"disappointing" -> "disappoint"``. Forms whose lemmas never reach the
+    lexicon are left out.
+
+    Needs the WordNet corpus; it is only used to build the lexicon file.
+
+    :param lexicon_words: Single-word lexicon entries, e.g. AFINN keys.
+    :type lexicon_words: Iterable[str]
+
+    :return: Mapping of inflected form to lexicon word.
+    :rtype: dict[str, str]
+    """
+    lexicon = set(lexicon_words)
+    lemmatizer = WordNetLemmatizer()
+
+    inflections = {}
+    for form in sorted(build_lemma_index(lexicon)):
+        for pos in LEMMA_POSITIONS:
+            lemma = lemmatizer.lemmatize(form, pos=pos)
+            if lemma in lexicon:
+                inflections[form] = lemma
+                break
+    return inflections
+
+
+def save_inflected_lexicon(filepath: str | Path = INFLECTED_LEXICON_PATH) -> None:
+    """
+    Build the inflected AFINN lexicon and write it to a TSV file.
+
+    This is the offline build step behind the ``"none"`` lemmatizer mode;
+    run ``python lemma_index.py`` to regenerate the file after updating
+    the AFINN lexicon.
+
+    :param filepath: Where to write the file. Defaults to
+                     ``INFLECTED_LEXICON_PATH``.
+    :type filepath: str | Path, optional
+
+    :return: None
+    :rtype: None
+    """
+    inflections = build_inflected_lexicon(word for word in get_afinn() if " " not in word)
+
+    # Write to a temporary file first so readers never see a partial file
+    tmp_path = f"{filepath}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(f"{form}\t{lemma}" for form, lemma in inflections.items()))
+    os.replace(tmp_path, filepath)
+
+
+# Caches the compiled lexicon so it can be reused
+@lru_cache(maxsize=1)
+def get_inflected_lexicon() -> dict[str, str]:
+    """
+    Load the inflected AFINN lexicon, building it on first use if missing.
+
+    Reading the file needs neither the POS tagger nor WordNet, which is
+    what makes the ``"none"`` lemmatizer mode cheap to start.
+
+    :return: Mapping of inflected form to AFINN word.
+    :rtype: dict[str, str]
+    """
+    with _lock:
+        if not INFLECTED_LEXICON_PATH.exists():
+            save_inflected_lexicon(INFLECTED_LEXICON_PATH)
+
+        inflections = {}
+        for line in INFLECTED_LEXICON_PATH.read_text(encoding="utf-8").splitlines():
+            form, lemma = line.split("\t")
+            inflections[form] = lemma
+        return inflections
+
+
+if __name__ == "__main__":
+    save_inflected_lexicon()
+    print(f"Wrote {len(get_inflected_lexicon())} inflected forms to {INFLECTED_LEXICON_PATH}")
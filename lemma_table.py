@@ -0,0 +1,143 @@
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable
+import os
+import threading
+from nltk.stem import WordNetLemmatizer
+from lemma_index import LEMMA_POSITIONS
+from unigram_freq import UNIGRAM_FREQ_MAP
+
+# Precomputed lemmas of the unigram vocabulary, one word per line:
+#   - "word" when every part of speech lemmatizes the word to itself
+#   - "word<TAB>noun<TAB>verb<TAB>adjective<TAB>adverb" otherwise, with an
+#     empty column where the lemma is the word itself
+# Built once from WordNet, see save_lemma_table()
+LEMMA_TABLE_PATH = Path(__file__).resolve().parent / "unigram_lemmas.tsv"
+
+# Column of each WordNet part of speech in a table row
+POS_COLUMNS = {pos: column for column, pos in enumerate(LEMMA_POSITIONS)}
+
+# Used for out-of-vocabulary words only
+lemmatizer = WordNetLemmatizer()
+
+# Used in get_lemma_table()
+_lock = threading.Lock()
+
+# Table lookups answered ("hits") and passed on to WordNet ("misses")
+_lookups = Counter()
+
+
+def build_lemma_table(words: Iterable[str]) -> dict[str, tuple[str, ...]]:
+    """
+    Lemmatize every word for each part of speech in ``LEMMA_POSITIONS``.
+
+    Needs the WordNet corpus; it is only used to build the table file.
+
+    :param words: Vocabulary to precompute, e.g. ``UNIGRAM_FREQ_MAP``.
+    :type words: Iterable[str]
+
+    :return: Mapping of word to its lemmas, in ``LEMMA_POSITIONS`` order.
+    :rtype: dict[str, tuple[str, ...]]
+    """
+    return {
+        word: tuple(lemmatizer.lemmatize(word, pos=pos) for pos in LEMMA_POSITIONS)
+        for word in words
+    }
+
+
+def save_lemma_table(filepath: str | Path = LEMMA_TABLE_PATH) -> None:
+    """
+    Build the lemma table for the unigram vocabulary and write it to disk.
+
+    Run ``python lemma_table.py`` to regenerate the file after changing
+    ``unigram_freq.py``.
+
+    :param filepath: Where to write the file. Defaults to
+                     ``LEMMA_TABLE_PATH``.
+    :type filepath: str | Path, optional
+
+    :return: None
+    :rtype: None
+    """
+    lines = []
+    for word, lemmas in build_lemma_table(UNIGRAM_FREQ_MAP).items():
+        # Words that never change take a single column
+        if all(lemma == word for lemma in lemmas):
+            lines.append(word)
+        else:
+            lines.append("\t".join([word] + ["" if lemma == word else lemma for lemma in lemmas]))
+
+    # Write to a temporary file first so readers never see a partial file
+    tmp_path = f"{filepath}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines))
+    os.replace(tmp_path, filepath)
+
+
+# Caches the table so it is read from disk once per process
+@lru_cache(maxsize=1)
+def get_lemma_table() -> dict[str, tuple[str, ...]]:
+    """
+    Load the lemma table, building it on first use if the file is missing.
+
+    :return: Mapping of word to its lemmas, in ``LEMMA_POSITIONS`` order.
+    :rtype: dict[str, tuple[str, ...]]
+    """
+    with _lock:
+        if not LEMMA_TABLE_PATH.exists():
+            save_lemma_table(LEMMA_TABLE_PATH)
+
+        table = {}
+        for line in LEMMA_TABLE_PATH.read_text(encoding="utf-8").splitlines():
+            word, *lemmas = line.split("\t")
+            # An empty or missing column means the word is its own lemma
+            table[word] = tuple(lemma or word for lemma in lemmas) if lemmas else (word,) * len(LEMMA_POSITIONS)
+        return table
+
+
+def lookup_lemma(word: str, pos: str) -> str:
+    """
+    Lemmatize a word, using the precomputed table when it knows the word.
+
+    Gives the same result as ``WordNetLemmatizer.lemmatize(word, pos)``;
+    only words outside the unigram vocabulary reach WordNet.
+
+    :param word: Lowercase word to lemmatize.
+    :type word: str
+
+    :param pos: WordNet part of speech, one of ``LEMMA_POSITIONS``.
+    :type pos: str
+
+    :return: The lemma of the word.
+    :rtype: str
+    """
+    lemmas = get_lemma_table().get(word)
+    if lemmas is None:
+        _lookups["misses"] += 1
+        return lemmatizer.lemmatize(word, pos=pos)
+
+    _lookups["hits"] += 1
+    return lemmas[POS_COLUMNS[pos]]
+
+
+def lemma_table_stats() -> dict:
+    """
+    Hit and miss counters of ``lookup_lemma`` since the process started.
+
+    :return: Table size, hits, misses and hit rate.
+    :rtype: dict
+    """
+    hits, misses = _lookups["hits"], _lookups["misses"]
+    total = hits + misses
+    return {
+        "size": len(get_lemma_table()),
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / total, 4) if total else 0.0,
+    }
+
+
+if __name__ == "__main__":
+    save_lemma_table()
+    print(f"Wrote lemmas of {len(UNIGRAM_FREQ_MAP)} words to {LEMMA_TABLE_PATH}")
@@ -117,9 +117,121 @@ def fold_multiword_phrases(
     return folded_tokens, matches
 
 
+# Key marking the end of a phrase inside a trie node (tokens are always strings)
+PHRASE_END = None
+
+
+def compile_phrase_matcher(
+    multiword_dict: dict[tuple[str, ...], int],
+    max_length: int,
+    alias_map: Optional[dict[tuple[str, ...], tuple[str, ...]]] = None
+) -> dict:
+    """
+    Compile multiword phrases and aliases into a token trie.
+
+    Each node maps the next token to a child node; a node where a phrase
+    ends also holds ``PHRASE_END -> (term, score)`` with the joined term
+    string. Aliases are stored under their own tokens with the canonical
+    term, so they cost nothing extra at match time.
+
+    Matches exactly what ``fold_multiword_phrases`` finds:
+      • Only phrases of 2..max_length tokens can match.
+      • An alias only matches if its canonical phrase is in the dict.
+      • Where a window is both a phrase and an alias, the phrase wins.
+
+    Args:
+        multiword_dict: Tuple-keyed multiword sentiment dictionary.
+        max_length: Maximum n-gram size to consider (in tokens).
+        alias_map: Optional tuple-keyed alias map.
+
+    Returns:
+        The root node of the trie.
+    """
+    entries: dict[tuple[str, ...], tuple[str, int]] = {}
+
+    # Aliases first so a direct phrase with the same tokens overwrites them
+    for alias, canonical in (alias_map or {}).items():
+        score = multiword_dict.get(canonical)
+        if score is not None:
+            entries[alias] = (" ".join(canonical), score)
+    for phrase, score in multiword_dict.items():
+        entries[phrase] = (" ".join(phrase), score)
+
+    root: dict = {}
+    for phrase, term in entries.items():
+        if not 2 <= len(phrase) <= max_length:
+            continue
+        node = root
+        for token in phrase:
+            node = node.setdefault(token, {})
+        node[PHRASE_END] = term
+    return root
+
+
+def fold_multiword_phrases_compiled(tokens: list[str], matcher: dict) -> tuple[list[str], list[dict]]:
+    """
+    Fold multiword phrases with a trie from ``compile_phrase_matcher``.
+
+    Same result as ``fold_multiword_phrases`` in one left-to-right pass:
+    from each position the trie is followed token by token while it has
+    a matching child, remembering the deepest phrase end seen (the
+    longest match). No windows or tuples are built; for most tokens the
+    walk stops after a single dict lookup because no phrase starts there.
+
+    Args:
+        tokens: Tokenized sentence/segment.
+        matcher: Compiled trie.
+
+    Returns:
+        folded_tokens, matches
+    """
+    position = 0
+    total_tokens = len(tokens)
+    folded_tokens: list[str] = []
+    matches: list[dict] = []
+
+    while position < total_tokens:
+        node = matcher.get(tokens[position])
+        matched_length = 0
+        matched_term = None
+
+        # Walk as deep as the tokens allow, keeping the longest phrase end
+        depth = 1
+        while node is not None:
+            term = node.get(PHRASE_END)
+            if term is not None:
+                matched_length, matched_term = depth, term
+            if position + depth >= total_tokens:
+                break
+            node = node.get(tokens[position + depth])
+            depth += 1
+
+        if matched_length:
+            # Fold the phrase once
+            term_str, score = matched_term
+            folded_tokens.append(term_str)
+            matches.append({
+                "term": term_str,
+                "score": score,
+                "start": position,
+                "length": matched_length,
+            })
+            position += matched_length
+        else:
+            # Keep the single token
+            folded_tokens.append(tokens[position])
+            position += 1
+
+    return folded_tokens, matches
+
+
 # Build the tuple-keyed dictionary + longest phrase length ONCE using Afinn
 multiword_tuples, max_phrase_length = build_multiword_info_tuples()
 
+# Compiled matcher for the last alias map seen, rebuilt only when a different
+# map object is passed (the alias loader caches its map, so normally never)
+_compiled_matcher: Optional[tuple[Optional[dict[str, str]], dict]] = None
+
 
 def fold_multiword_phrases_using_globals(
     tokens: list[str],
@@ -130,6 +242,7 @@ def fold_multiword_phrases_using_globals(
       - multiword_tuples (tuple-keyed phrases)
       - max_phrase_length (longest phrase length)
       - optional alias map converted to tuple form
+    compiled into a phrase matcher once per alias map.
 
     Args:
         tokens: Tokenized sentence/segment.
@@ -138,5 +251,10 @@ def fold_multiword_phrases_using_globals(
     Returns:
         folded_tokens, matches
     """
-    alias_map_tuples = convert_aliases_to_tuples(alias_map_strings or {})
-    return fold_multiword_phrases(tokens, multiword_tuples, max_phrase_length, alias_map_tuples)
+    global _compiled_matcher
+    cached = _compiled_matcher
+    if cached is None or cached[0] is not alias_map_strings:
+        alias_map_tuples = convert_aliases_to_tuples(alias_map_strings or {})
+        cached = (alias_map_strings, compile_phrase_matcher(multiword_tuples, max_phrase_length, alias_map_tuples))
+        _compiled_matcher = cached
+    return fold_multiword_phrases_compiled(tokens, cached[1])
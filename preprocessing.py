@@ -3,7 +3,7 @@ import unicodedata2
 import re
 import nltk
 import os
-from typing import List, Optional
+from typing import Callable, Iterable, Iterator, List, Optional
 from nltk import WordNetLemmatizer
 from nltk.corpus import stopwords, wordnet
 from nltk.tokenize.toktok import ToktokTokenizer
@@ -11,8 +11,13 @@ from contractions import CONTRACTION_MAP
 from afinn_loader import get_afinn
 from multiword_restore import fold_multiword_phrases_using_globals
 from aliases import load_alias_map
+from lemma_index import get_lemma_index, get_inflected_lexicon
+from lemma_table import lookup_lemma
+from bounded_cache import BoundedCache
+from sentence_records import Sentence
 from collections import Counter, deque
-from functools import lru_cache
+import hashlib
+from itertools import groupby
 
 # Download only required nltk packages
 nltk.download("punkt", quiet=True)
@@ -21,13 +26,21 @@ nltk.download("wordnet", quiet=True)
 nltk.download("omw-1.4", quiet=True)
 nltk.download('stopwords', quiet=True)
 
-# Build a regex pattern to match contractions (using the contraction mapping in ``contractions.py``):
-#   - Escape special characters in each contraction (like ' in y'all).
-#   - ordered longest-first for accuracy so "you'd've" matches before "you'd" (Prevents false positive).
-#   - Join with "|" so regex can match any one of them.
-CONTRACTION_PATTERN = re.compile(
-    r'(' + '|'.join(sorted(map(re.escape, CONTRACTION_MAP), key=len, reverse=True)) + r')'
-)
+# Typographic apostrophes treated like "'" (right and left single quotes)
+CURLY_APOSTROPHES = "\u2019\u2018"
+APOSTROPHE_FOLD = str.maketrans(CURLY_APOSTROPHES, "'" * len(CURLY_APOSTROPHES))
+
+# Contractions by lowercase form, for the case-insensitive lookup in
+# ``convert_contractions``; lowercase keys of the map win over capitalised ones
+CONTRACTION_MAP_LOWER = {
+    **{contraction.lower(): expansion for contraction, expansion in CONTRACTION_MAP.items()},
+    **{contraction: expansion for contraction, expansion in CONTRACTION_MAP.items() if contraction.islower()},
+}
+
+# Matches a word that contains at least one apostrophe (straight or curly),
+# the only places a contraction can be. Words are runs of letters and
+# apostrophes, so "(don't)" or "can't!" still give "don't" and "can't".
+apostrophe_word = re.compile(r"[a-zA-Z'\u2019\u2018]*['\u2019\u2018][a-zA-Z'\u2019\u2018]*")
 
 # Initialize tokenizer, lemmatizer, and afinn globally.
 # Cache stopword set
@@ -37,6 +50,70 @@ afinn = get_afinn()
 alias_map = None
 _STOPWORD_CACHE = None
 
+# Final tokens of each sentence seen so far, keyed by the lexicon version and
+# a digest of the original sentence text, so repeated boilerplate sentences
+# ("Spoilers ahead.") are only tokenized once. Sized by SENTENCE_CACHE_SIZE;
+# its hit rate is reported under /stats.
+SENTENCE_CACHE_SIZE = int(os.environ.get("SENTENCE_CACHE_SIZE", "4096"))
+sentence_cache = BoundedCache(SENTENCE_CACHE_SIZE)
+
+# Final token form of each (word, POS tag letter) pair seen so far, keyed by
+# the lexicon version like sentence_cache and shared by every sentence and
+# request in this process. Sized by WORD_MEMO_SIZE; its evictions are
+# reported under /stats.
+WORD_MEMO_SIZE = int(os.environ.get("WORD_MEMO_SIZE", "8192"))
+word_memo = BoundedCache(WORD_MEMO_SIZE)
+
+# Version of the lexicon data the cached tokens were built with, see lexicon_version()
+_lexicon_version = (None, None)
+
+# How tokens are lemmatized:
+#   - "full" (the default): POS tag and lemmatize every non-stopword
+#   - "lexicon": only the inflected AFINN forms of ``afinn_inflections.tsv``
+#     (see ``lemma_index.py``) are lemmatized; sentences without one are not
+#     tagged at all and other tokens keep their surface form. A form missing
+#     from the table does not score where "full" would score its lemma, e.g.
+#     "betrayals" (noun plurals are only listed when they are in the unigram
+#     vocabulary). ``TestLemmatizerModes`` in tests/preprocessing.py pins the
+#     differences on a fixed corpus.
+#   - "none": no tagger or WordNet at all; the forms of the same table are
+#     replaced by their AFINN word. On top of the "lexicon" differences, a
+#     form whose lemma depends on its part of speech may score where "full"
+#     would not.
+LEMMATIZER_MODES = ("full", "lexicon", "none")
+LEMMATIZER_MODE = os.environ.get("LEMMATIZER_MODE", "full")
+
+# Paragraphs in the uploaded reviews are separated by a double line break
+PARAGRAPH_DELIMITER = "<br /><br />"
+
+# Joins sentences for the document level cleaning pass in ``normalize_sentences``.
+# An ASCII control character that is also whitespace, so every cleaning step
+# keeps it and treats it like a sentence boundary.
+SENTENCE_SEPARATOR = "\x1e"
+
+# Characters the HTML parser counts as whitespace
+HTML_WHITESPACE = " \t\n\r\f"
+
+# Tags whose content BeautifulSoup leaves out of ``get_text`` (scripts,
+# styles, templates, ruby annotations) or parses differently from normal
+# text (raw text and whitespace preserving elements). Text containing them
+# always goes through the full parser.
+PARSER_ONLY_TAGS = frozenset({
+    "script", "style", "template", "rt", "rp", "pre", "textarea", "title",
+    "xmp", "iframe", "noembed", "noframes", "noscript", "plaintext",
+})
+
+# Matches a plain HTML tag that the fast path in ``remove_html_tags`` can drop:
+#   - a start tag with optional attributes (quoted or simple unquoted values)
+#     and an optional self-closing slash, like <br /> or <a href="x">
+#   - OR an end tag without attributes, like </i>
+simple_tag = re.compile(
+    r'<([a-zA-Z][a-zA-Z0-9]*)'
+    r'(?:\s+[a-zA-Z][-a-zA-Z0-9]*(?:\s*=\s*(?:"[^"<>]*"|\'[^\'<>]*\'|[^\s"\'<>=`/]+))?)*'
+    r'\s*/?>'
+    r'|</([a-zA-Z][a-zA-Z0-9]*)\s*>'
+)
+
 # Matches whitespace that follows a sentence-ending punctuation mark (., !, or ?)
 # Used to split text into sentences without losing the punctuation.
 sentence_splitting = re.compile(r'(?<=[.!?])\s+')
@@ -186,25 +263,122 @@ def lemmatize_text(text: list[str]) -> list[str]:
     #Tag the words
     pos_tags=nltk.pos_tag(text)
 
+    return lemmatize_tagged(pos_tags)
+
+
+def lemmatize_tagged(
+    pos_tags: list[tuple[str, str]],
+    candidates: Optional[frozenset[str]] = None
+) -> list[str]:
+    """
+    Lemmatize words that already carry a Penn Treebank POS tag.
+
+    The second half of ``lemmatize_text``, used directly when the tags
+    come from a batched ``nltk.pos_tag_sents`` call.
+
+    :param pos_tags: ``(word, tag)`` pairs of one sentence.
+    :type pos_tags: list[tuple[str, str]]
+
+    :param candidates: If given, only these words are lemmatized and every
+                       other word is kept as is.
+    :type candidates: frozenset[str], optional
+
+    :return: A list of lemmatized tokens, with original forms retained when
+             present in the AFINN dictionary.
+    :rtype: list[str]
+    """
+    version = lexicon_version()
     lemmas = []
     for word, tag in pos_tags:
-        # Map POS tag to WordNet's expected tag set
-        wn_pos = get_wordnet_position(tag)
-
-        # Lemmatize the word
-        lemma = lemmatizer.lemmatize(word, pos=wn_pos)
-        # Prefer form that exists in the AFINN Dictionary
-        lemmas.append(word if word in afinn else lemma)
+        # Words that cannot reach an AFINN entry keep their form
+        if candidates is not None and word not in candidates:
+            lemmas.append(word)
+            continue
+
+        # Words seen before, in any sentence or request, resolve in one lookup.
+        # The first letter of the tag is all get_wordnet_position looks at.
+        key = (version, word, tag[:1])
+        final = word_memo.get(key)
+        if final is None:
+            # Map POS tag to WordNet's expected tag set
+            wn_pos = get_wordnet_position(tag)
+
+            # Lemmatize the word, precomputed for common words
+            lemma = lookup_lemma(word, wn_pos)
+            # Prefer form that exists in the AFINN Dictionary
+            final = word if word in afinn else lemma
+            word_memo.put(key, final)
+        lemmas.append(final)
 
     return lemmas
 
 
+def collapse_blank_html_text(text: str) -> str:
+    """
+    Collapse text made only of HTML whitespace like BeautifulSoup does.
+
+    BeautifulSoup replaces every run of text between tags that consists
+    only of spaces, tabs, newlines, carriage returns or form feeds with a
+    single newline (if it had one) or a single space. Any other text is
+    returned unchanged.
+
+    :param text: Text found between two tags, or a whole tag-free string.
+    :type text: str
+
+    :return: The text as ``get_text`` would return it.
+    :rtype: str
+    """
+    if text and not text.strip(HTML_WHITESPACE):
+        return "\n" if "\n" in text else " "
+    return text
+
+
+def strip_simple_tags(text: str) -> Optional[str]:
+    """
+    Remove plain start and end tags without running an HTML parser.
+
+    Handles text whose markup consists only of ordinary tags such as
+    ``<br />``, ``<i>`` or ``<a href="...">``. Anything the regex cannot
+    vouch for (entities, comments, stray ``<`` characters, or tags whose
+    content BeautifulSoup skips or keeps verbatim) returns ``None`` so the
+    caller can use the full parser instead.
+
+    :param text: The string containing HTML content.
+    :type text: str
+
+    :return: The text with its tags removed, or ``None`` if the markup is
+             too complex for the fast path.
+    :rtype: str | None
+    """
+    if "&" in text:
+        return None
+
+    pieces = []
+    start = 0
+    for match in simple_tag.finditer(text):
+        tag_name = (match.group(1) or match.group(2)).lower()
+        if tag_name in PARSER_ONLY_TAGS:
+            return None
+        pieces.append(collapse_blank_html_text(text[start:match.start()]))
+        start = match.end()
+    pieces.append(collapse_blank_html_text(text[start:]))
+
+    stripped_text = "".join(pieces)
+    # A "<" left over means markup the regex did not understand
+    if "<" in stripped_text:
+        return None
+    return stripped_text
+
+
 def remove_html_tags(text: str) -> str:
     """
     Remove HTML tags from the given text.
 
-    Parses the text as HTML and strips out
-    any markup such as <div>, <p>, <span>, etc.
+    Strips out any markup such as <div>, <p>, <span>, etc. Text without
+    ``<`` or ``&`` is returned as is and simple tags are removed with a
+    regex; only complex markup (entities, comments, scripts, ...) is
+    parsed with BeautifulSoup. The result is the same as BeautifulSoup's
+    ``get_text`` in every case.
 
     :param text: The string containing HTML content.
     :type text: str
@@ -213,8 +387,14 @@ def remove_html_tags(text: str) -> str:
     :rtype: str
     """
 
-    soup = BeautifulSoup(text, "html.parser")
-    stripped_text = soup.get_text()
+    # Fast path: no markup at all, the common case after paragraph splitting
+    if "<" not in text and "&" not in text:
+        return collapse_blank_html_text(text)
+
+    stripped_text = strip_simple_tags(text)
+    if stripped_text is None:
+        soup = BeautifulSoup(text, "html.parser")
+        stripped_text = soup.get_text()
     return stripped_text
 
 
@@ -224,7 +404,8 @@ def convert_accented_characters(text: str) -> str:
     Convert accented Unicode characters to their closest ASCII equivalents.
 
     Uses Unicode normalization to strip diacritical marks, so strings like
-    "résumé" or "café" become "resume" and "cafe".
+    "résumé" or "café" become "resume" and "cafe". Curly apostrophes become
+    "'" so contractions like "don’t" are still expanded.
 
     :param text: The input string that might contain accented characters.
     :type text: str
@@ -233,6 +414,7 @@ def convert_accented_characters(text: str) -> str:
     :rtype: str
     """
 
+    text = text.translate(APOSTROPHE_FOLD)
     text = unicodedata2.normalize('NFKD', text).encode('ascii', 'ignore').decode('utf-8', 'ignore')
     return text
 
@@ -259,13 +441,53 @@ def remove_special_characters_and_numbers(text: str) -> str:
     return text
 
 
+def lookup_contraction(word: str) -> Optional[str]:
+    """
+    Expand a single word if it is a known contraction.
+
+    The lookup ignores case and curly apostrophes, and quote marks around
+    the word are kept: ``"'Don’t'"`` gives ``"'do not'"``.
+
+    :param word: A word containing an apostrophe.
+    :type word: str
+
+    :return: The expanded word, or ``None`` if it is not a contraction.
+    :rtype: str | None
+    """
+    expansion = CONTRACTION_MAP.get(word)
+    if expansion is not None:
+        return expansion
+
+    folded = word.translate(APOSTROPHE_FOLD).lower()
+    expansion = CONTRACTION_MAP_LOWER.get(folded)
+    if expansion is not None:
+        return expansion
+
+    # Apostrophes used as quote marks around the contraction
+    core = folded.strip("'")
+    if not core or core == folded:
+        return None
+    lead = word[:len(folded) - len(folded.lstrip("'"))]
+    trail = word[len(lead) + len(core):]
+    expansion = CONTRACTION_MAP_LOWER.get(core)
+    if expansion is not None:
+        return lead + expansion + trail
+    # Contractions that start with an apostrophe, like 'cause
+    expansion = CONTRACTION_MAP_LOWER.get("'" + core)
+    if expansion is not None:
+        return lead[:-1] + expansion + trail
+    return None
+
+
 def convert_contractions(text: str) -> str:
     """
     Expand contractions found in text using predefined contraction map.
 
-    The function searches for patterns defined in ``CONTRACTION_PATTERN`` and
-    replaces each match with its expanded form according to ``CONTRACTION_MAP``.
-    Matching is case-sensitive, so only exact forms are replaced.
+    Text without an apostrophe is returned straight away. Otherwise every
+    word containing an apostrophe is looked up in ``CONTRACTION_MAP`` (see
+    ``lookup_contraction``) and replaced with its expanded form; other
+    words are left alone. Matching is done on whole words, ignores case
+    and accepts curly apostrophes.
 
     :param text: The string containing possible contractions.
     :type text: str
@@ -274,22 +496,485 @@ def convert_contractions(text: str) -> str:
     :rtype: str
     """
 
-    # Inner function is called for each match found by regex
+    # Fast path: no apostrophe means no contraction
+    if "'" not in text and "\u2019" not in text and "\u2018" not in text:
+        return text
+
+    # Inner function is called for each word with an apostrophe
     def replace_contractions(match: re.Match[str]) -> str:
-        # Get the matched contraction from the text
-        contraction = match.group(0)
+        # Get the matched word from the text
+        word = match.group(0)
         # return expanded form, otherwise return original form
-        expansion = CONTRACTION_MAP.get(contraction)
-        return expansion
+        expansion = lookup_contraction(word)
+        return word if expansion is None else expansion
 
     # Go through text to find a match, then call replace_contractions function
-    return CONTRACTION_PATTERN.sub(replace_contractions, text)
+    return apostrophe_word.sub(replace_contractions, text)
+
+
+def iter_paragraphs(text: str) -> Iterator[str]:
+    """
+    Lazily split text into paragraphs on ``<br /><br />``.
+
+    Paragraphs are stripped of surrounding whitespace and empty ones are
+    skipped. Unlike ``str.split`` no list of all paragraphs is built, so
+    the caller only ever holds the paragraph it is working on.
+
+    :param text: The full input string.
+    :type text: str
+
+    :return: An iterator over the non-empty, stripped paragraphs.
+    :rtype: Iterator[str]
+    """
+    for paragraph in iter_raw_paragraphs(text):
+        paragraph = paragraph.strip()
+        if paragraph:
+            yield paragraph
+
+
+def iter_raw_paragraphs(text: str) -> Iterator[str]:
+    """
+    Lazily split text on ``<br /><br />``, keeping every piece as it is.
+
+    Joining the pieces with ``PARAGRAPH_DELIMITER`` gives back the text,
+    which is what ``iter_paragraph_sentences`` relies on for its offsets.
+
+    :param text: The full input string.
+    :type text: str
+
+    :return: An iterator over the unstripped pieces, empty ones included.
+    :rtype: Iterator[str]
+    """
+    start = 0
+    while True:
+        end = text.find(PARAGRAPH_DELIMITER, start)
+        yield text[start:] if end == -1 else text[start:end]
+        if end == -1:
+            return
+        start = end + len(PARAGRAPH_DELIMITER)
+
+
+def iter_sentence_spans(paragraph: str) -> Iterator[tuple[int, int]]:
+    """
+    Find the sentences of a stripped paragraph as (start, end) offsets.
+
+    The same pieces as ``sentence_splitting.split(paragraph)``, without
+    copying them.
+
+    :param paragraph: A stripped, non-empty paragraph.
+    :type paragraph: str
+
+    :return: An iterator of ``(start, end)`` offsets into the paragraph.
+    :rtype: Iterator[tuple[int, int]]
+    """
+    start = 0
+    for match in sentence_splitting.finditer(paragraph):
+        yield start, match.start()
+        start = match.end()
+    yield start, len(paragraph)
+
+
+def iter_sentences(text: str) -> Iterator[tuple[int, int, str, int]]:
+    """
+    Lazily split text into numbered sentences.
+
+    Paragraphs are split on ``<br /><br />`` like ``iter_paragraphs`` does
+    and then into sentences with ``sentence_splitting``, keeping the
+    punctuation attached.
+
+    :param text: The full input string.
+    :type text: str
+
+    :return: An iterator of ``(paragraph index, sentence index, sentence,
+             start offset)`` tuples, both indices 1-based. The sentence is
+             ``text[start:start + len(sentence)]``.
+    :rtype: Iterator[tuple[int, int, str, int]]
+    """
+    return iter_paragraph_sentences(iter_raw_paragraphs(text))
+
+
+def iter_paragraph_sentences(paragraphs: Iterable[str]) -> Iterator[tuple[int, int, str, int]]:
+    """
+    Number and split already separated paragraphs into sentences.
+
+    Paragraphs are stripped and empty ones skipped, exactly like
+    ``iter_paragraphs`` does, so the numbering matches ``iter_sentences``
+    on the joined text. Offsets are into the paragraphs joined with
+    ``PARAGRAPH_DELIMITER``.
+
+    :param paragraphs: Raw paragraphs, e.g. from an upload reader.
+    :type paragraphs: Iterable[str]
+
+    :return: An iterator of ``(paragraph index, sentence index, sentence,
+             start offset)`` tuples, both indices 1-based.
+    :rtype: Iterator[tuple[int, int, str, int]]
+    """
+    p = 0
+    # Offset of the current raw paragraph in the joined text
+    offset = 0
+    for raw in paragraphs:
+        para = raw.strip()
+        if para:
+            p += 1
+            para_start = offset + len(raw) - len(raw.lstrip())
+            for s, (start, end) in enumerate(iter_sentence_spans(para), 1):
+                yield p, s, para[start:end], para_start + start
+        offset += len(raw) + len(PARAGRAPH_DELIMITER)
+
+
+def ensure_alias_map(alias_tsv_path: Optional[str] = "afinn_aliases.tsv") -> None:
+    """
+    Load the global alias map on first use.
+
+    Falls back to an empty map if the TSV file cannot be read. Nothing is
+    loaded when ``alias_tsv_path`` is empty.
+
+    :param alias_tsv_path: Path to the alias TSV file.
+    :type alias_tsv_path: str, optional
+
+    :return: None
+    :rtype: None
+    """
+    global alias_map
+    if alias_map is None and alias_tsv_path:
+        try:
+            alias_map = load_alias_map(alias_tsv_path)
+        except Exception:
+            alias_map = {}
+
+
+def normalize_sentence(sentence: str) -> str:
+    """
+    Run the character level cleaning steps on a single sentence.
+
+    Lowercasing, accent and HTML removal, contraction expansion and special
+    character removal, in that order. ``normalize_sentences`` does the same
+    for many sentences in one pass.
+
+    :param sentence: The original sentence text.
+    :type sentence: str
+
+    :return: The cleaned sentence, ready to be tokenized.
+    :rtype: str
+    """
+    clean_lower = sentence.lower()
+
+    clean_accented = convert_accented_characters(clean_lower)
+
+    clean_html = remove_html_tags(clean_accented)
+
+    # Convert contractions before removing special characters for best results
+    clean_contractions = convert_contractions(clean_html)
+
+    return remove_special_characters_and_numbers(clean_contractions)
+
+
+def normalize_sentences(sentences: list[str]) -> list[str]:
+    """
+    Clean many sentences with one pass of each cleaning step.
+
+    The sentences are joined with ``SENTENCE_SEPARATOR`` and lowercasing,
+    accent removal, contraction expansion and special character removal
+    each run once over the joined text instead of once per sentence. The
+    separator positions are the offset map back to the sentences: the text
+    between the (i-1)th and ith separator is the cleaned sentence i.
+
+    HTML parsing depends on context (an unclosed tag, comment or entity at
+    the end of a sentence parses differently when more text follows), so
+    it is still done per sentence; ``remove_html_tags`` returns markup-free
+    sentences without parsing them.
+
+    The separator is an ASCII whitespace character, so the other steps
+    treat it exactly like the end of a sentence. If it does not survive
+    (the input already contains it, or an entity produces it) the
+    sentences are cleaned one by one instead.
+
+    :param sentences: Original sentence texts.
+    :type sentences: list[str]
+
+    :return: The cleaned sentences, in the same order.
+    :rtype: list[str]
+    """
+    if len(sentences) < 2:
+        return [normalize_sentence(sentence) for sentence in sentences]
+
+    document = SENTENCE_SEPARATOR.join(sentences)
+    if document.count(SENTENCE_SEPARATOR) == len(sentences) - 1:
+        clean_accented = convert_accented_characters(document.lower()).split(SENTENCE_SEPARATOR)
+
+        # HTML stays per sentence; markup-free sentences take the fast path
+        clean_html = SENTENCE_SEPARATOR.join(remove_html_tags(part) for part in clean_accented)
+
+        # Convert contractions before removing special characters for best results
+        clean_contractions = convert_contractions(clean_html)
+        cleaned = remove_special_characters_and_numbers(clean_contractions).split(SENTENCE_SEPARATOR)
+        if len(cleaned) == len(sentences):
+            return cleaned
+
+    # Separator was lost or duplicated, fall back to the per sentence path
+    return [normalize_sentence(sentence) for sentence in sentences]
+
+
+def lexicon_version(mode: Optional[str] = None) -> str:
+    """
+    Fingerprint the data that decides the tokens of a sentence.
+
+    Covers the AFINN lexicon, the alias map and the lemmatizer mode, so a
+    change to any of them gives cached sentences a new key. Recomputed only
+    when the global alias map object changes.
+
+    :param mode: One of ``LEMMATIZER_MODES``. Defaults to ``LEMMATIZER_MODE``.
+    :type mode: str, optional
+
+    :return: A short hexadecimal version string.
+    :rtype: str
+    """
+    global _lexicon_version
+    cached_map, version = _lexicon_version
+    if version is None or cached_map is not alias_map:
+        digest = hashlib.sha256()
+        for word, score in sorted(afinn.items()):
+            digest.update(f"{word}\t{score}\n".encode("utf-8"))
+        for alias, phrase in sorted((alias_map or {}).items()):
+            digest.update(f"{alias}\t{phrase}\n".encode("utf-8"))
+        version = digest.hexdigest()[:16]
+        _lexicon_version = (alias_map, version)
+    return f"{mode or LEMMATIZER_MODE}:{version}"
+
+
+def tokenize_sentences_cached(sentences: list[str], mode: Optional[str] = None) -> list[list[str]]:
+    """
+    Tokenize original sentences, reusing the tokens of sentences seen before.
+
+    Sentences are looked up in ``sentence_cache``; only the misses are
+    cleaned with ``normalize_sentences`` and tokenized in one
+    ``tokenize_normalized_sentences`` batch, and a sentence repeated
+    within the batch is tokenized once.
+
+    :param sentences: Original sentence texts.
+    :type sentences: list[str]
+
+    :param mode: One of ``LEMMATIZER_MODES``. Defaults to ``LEMMATIZER_MODE``.
+    :type mode: str, optional
+
+    :return: The final processed tokens of each sentence, in input order.
+    :rtype: list[list[str]]
+    """
+    version = lexicon_version(mode)
+    keys = [(version, hashlib.blake2b(sentence.encode("utf-8"), digest_size=16).digest())
+            for sentence in sentences]
+
+    token_lists = [None] * len(sentences)
+    # Position of the first occurrence of each missing key
+    misses = {}
+    for i, key in enumerate(keys):
+        if key in misses:
+            continue
+        tokens = sentence_cache.get(key)
+        if tokens is None:
+            misses[key] = i
+        else:
+            token_lists[i] = list(tokens)
+
+    if misses:
+        positions = list(misses.values())
+        cleaned = normalize_sentences([sentences[i] for i in positions])
+        for i, tokens in zip(positions, tokenize_normalized_sentences(cleaned, mode)):
+            sentence_cache.put(keys[i], tuple(tokens))
+            token_lists[i] = tokens
+
+    # Repeats of a sentence that was missing get their own copy of its tokens
+    for i, key in enumerate(keys):
+        if token_lists[i] is None:
+            token_lists[i] = list(token_lists[misses[key]])
+
+    return token_lists
+
+
+def tokenize_sentence(sentence: str) -> list[str]:
+    """
+    Clean and tokenize a single sentence.
+
+    Runs the per-sentence steps of ``complete_tokenization``: lowercasing,
+    accent and HTML removal, contraction expansion, special character
+    removal, tokenizing, multi-word folding, stopword removal and
+    lemmatization. Uses the global alias map, see ``ensure_alias_map``.
+
+    :param sentence: The original sentence text.
+    :type sentence: str
+
+    :return: The final processed tokens.
+    :rtype: list[str]
+    """
+    return tokenize_normalized(normalize_sentence(sentence))
+
+
+def tokenize_normalized(clean_special: str) -> list[str]:
+    """
+    Tokenize a sentence that has already been cleaned.
+
+    The word level half of ``tokenize_sentence``: tokenizing, multi-word
+    folding, stopword removal and lemmatization.
+
+    :param clean_special: Output of ``normalize_sentence`` or
+                          ``normalize_sentences``.
+    :type clean_special: str
+
+    :return: The final processed tokens.
+    :rtype: list[str]
+    """
+    return tokenize_normalized_sentences([clean_special])[0]
+
+
+def tokenize_normalized_sentences(cleaned: list[str], mode: Optional[str] = None) -> list[list[str]]:
+    """
+    Tokenize many cleaned sentences with a single POS tagging call.
+
+    Every sentence is tokenized, folded and stopword filtered first, then
+    the remaining single words of all sentences are tagged together with
+    ``nltk.pos_tag_sents`` and the lemmas are scattered back into each
+    sentence in order. Tagging still looks at one sentence at a time, so
+    the tokens are the same as from ``tokenize_normalized``.
+
+    In ``"lexicon"`` mode only sentences containing a word from the lemma
+    index are tagged (whole, as the tagger uses the surrounding words) and
+    only those words are lemmatized. In ``"none"`` mode nothing is tagged
+    and inflected AFINN forms are replaced straight from the compiled
+    inflection lexicon.
+
+    :param cleaned: Cleaned sentences, e.g. every sentence of a document or
+                    of several documents.
+    :type cleaned: list[str]
+
+    :param mode: One of ``LEMMATIZER_MODES``. Defaults to ``LEMMATIZER_MODE``.
+    :type mode: str, optional
+
+    :return: The final processed tokens of each sentence, in input order.
+    :rtype: list[list[str]]
+
+    :raises ValueError: If the mode is unknown.
+    """
+    mode = mode or LEMMATIZER_MODE
+    if mode not in LEMMATIZER_MODES:
+        raise ValueError(f"Unknown lemmatizer mode {mode!r}, expected one of {LEMMATIZER_MODES}")
+
+    folded = [fold_sentence_tokens(clean_special) for clean_special in cleaned]
+
+    if mode == "none":
+        inflections = get_inflected_lexicon()
+        return [
+            rebuild_sentence_tokens(folded_tokens, singles, singles_wo_stop,
+                                    [word if word in afinn else inflections.get(word, word)
+                                     for word in singles_wo_stop])
+            for folded_tokens, singles, singles_wo_stop in folded
+        ]
+
+    candidates = get_lemma_index() if mode == "lexicon" else None
+    if candidates is None:
+        to_tag = list(range(len(folded)))
+    else:
+        # Sentences without a word that can reach an AFINN entry skip tagging
+        to_tag = [i for i, (_, _, singles_wo_stop) in enumerate(folded)
+                  if any(word in candidates for word in singles_wo_stop)]
+
+    # One tagger call for the whole batch instead of one per sentence
+    tagged = nltk.pos_tag_sents([folded[i][2] for i in to_tag])
+
+    # Untagged sentences keep their words as they are
+    lemmas = [singles_wo_stop for _, _, singles_wo_stop in folded]
+    for i, pos_tags in zip(to_tag, tagged):
+        lemmas[i] = lemmatize_tagged(pos_tags, candidates)
+
+    return [
+        rebuild_sentence_tokens(folded_tokens, singles, singles_wo_stop, sentence_lemmas)
+        for (folded_tokens, singles, singles_wo_stop), sentence_lemmas in zip(folded, lemmas)
+    ]
+
+
+def fold_sentence_tokens(clean_special: str) -> tuple[list[str], list[str], list[str]]:
+    """
+    Tokenize a cleaned sentence, fold multi-words and drop stopwords.
+
+    :param clean_special: A cleaned sentence.
+    :type clean_special: str
+
+    :return: The folded tokens, their single-word tokens, and those single
+             words without stopwords (the words that get lemmatized).
+    :rtype: tuple[list[str], list[str], list[str]]
+    """
+    # Tokenize text
+    clean_tokens = tokenizer.tokenize(clean_special)
+
+    whitespace_tokens = [token.strip() for token in clean_tokens if token.strip()]
+
+    # Fold multi-words with alias matching
+    folded_tokens, matches = fold_multiword_phrases_using_globals(
+        whitespace_tokens, alias_map
+    )
+
+    # Applies stopword removal and lemmatization only for single-word tokens
+    singles = [t for t in folded_tokens if " " not in t]
+
+    # While keeping order, compute lemmas for singles
+    singles_wo_stop = remove_stopwords(singles)
+
+    return folded_tokens, singles, singles_wo_stop
+
+
+def rebuild_sentence_tokens(
+    folded_tokens: list[str],
+    singles: list[str],
+    singles_wo_stop: list[str],
+    lemmas: list[str]
+) -> list[str]:
+    """
+    Put the lemmas back in place of the kept single-word tokens.
+
+    :param folded_tokens: Tokens after multi-word folding.
+    :type folded_tokens: list[str]
+
+    :param singles: The single-word tokens of ``folded_tokens``.
+    :type singles: list[str]
+
+    :param singles_wo_stop: ``singles`` without stopwords.
+    :type singles_wo_stop: list[str]
+
+    :param lemmas: Lemmas of ``singles_wo_stop``, in the same order.
+    :type lemmas: list[str]
+
+    :return: The final processed tokens.
+    :rtype: list[str]
+    """
+    # Use a deque for O(1) pops from the left
+    singles_lemmas = deque(lemmas)
+
+    # Counts how many times each kept single should appear (preserve multiplicity)
+    keep_counts = Counter(singles_wo_stop)
+
+    #Rebuild the sequence of words in order keeping multi-word tokens as it is
+    clean_completed: List[str] = []
+    idx_single = 0
+    for tok in folded_tokens:
+        if " " in tok:
+            clean_completed.append(tok)
+        else:
+            # If the current single-word token is not a stopword and unused,
+            # replace it with the next available lemma in the same positional order.
+            # Checks multiplicity
+            if idx_single < len(singles) and keep_counts[singles[idx_single]] > 0:
+                clean_completed.append(singles_lemmas.popleft())
+                keep_counts[singles[idx_single]] -= 1
+            # advance original singles cursor
+            idx_single += 1
+
+    return clean_completed
 
 
 def complete_tokenization(
     text: str,
-    alias_tsv_path: Optional[str] = "afinn_aliases.tsv"
-) -> list[dict[str, int | str | list[str]]]:
+    alias_tsv_path: Optional[str] = "afinn_aliases.tsv",
+    progress: Optional[Callable[[int, int, Sentence], None]] = None
+) -> list[Sentence]:
 
     """
     Fully tokenize text into paragraphs, sentences, and cleaned token lists.
@@ -315,7 +1000,8 @@ def complete_tokenization(
         • Preserves original order to insert lemmatized tokens in
           original order
         • Returns a hierarchical structure containing paragraph index,
-          sentence index, original sentence text, and the final tokens.
+          sentence index, the offsets of the sentence in the text, and
+          the final tokens.
 
     :param text: The full input string to tokenize, might contain
                  HTML like <br/> and multi-paragraph content.
@@ -326,91 +1012,132 @@ def complete_tokenization(
                            ``"afinn_aliases.tsv"``.
     :type alias_tsv_path: str, optional
 
-    :return: A list of dictionaries, each representing a sentence with:
-             - ``"para"`` (int): Paragraph index (1-based),
-             - ``"sentence"`` (int): Sentence index within the paragraph (1-based),
-             - ``"original"`` (str): The original sentence text,
-             - ``"tokens"`` (list[str]): The final processed tokens.
-    :rtype: list[SentenceTokens]
+    :param progress: Optional callback invoked after each sentence with the
+                     number of sentences processed so far, the total
+                     number of sentences in the text and the new sentence
+                     record.
+    :type progress: Callable[[int, int, Sentence], None], optional
+
+    :return: A list of ``Sentence`` records, each with:
+             - ``para`` (int): Paragraph index (1-based),
+             - ``sentence`` (int): Sentence index within the paragraph (1-based),
+             - ``start``, ``end`` (int): Offsets of the sentence, so the
+               original sentence is ``text[start:end]``
+               (see ``sentence_records.sentence_text``),
+             - ``tokens`` (list[str]): The final processed tokens.
+    :rtype: list[Sentence]
     """
 
-    # Splits paragraphs on <br /><br /> HTML
-    # If p.strip() ensures empty paragraphs are ignored
-    paragraphs = [p.strip() for p in text.split("<br /><br />") if p.strip()]
-
     hierarchical_tokens = []
 
-    global alias_map
-    if alias_map is None and alias_tsv_path:
-        try:
-            alias_map = load_alias_map(alias_tsv_path)
-        except Exception:
-            alias_map = {}
+    ensure_alias_map(alias_tsv_path)
 
+    # Split into the sentences of every paragraph
+    # Paragraphs are split on <br /><br /> HTML and empty ones are ignored,
+    # sentences are split on punctuation (. ! ?) which stays attached.
+    sentences = list(iter_sentences(text))
+    total_sentences = len(sentences)
 
-    # Loop through paragraphs
-    for p, para in enumerate(paragraphs, 1):
-        # Loop through sentences
-        # Split paragraph into sentences based on punctuation (. ! ?),
-        # keep the punctuation attached to the sentence.
-        for s, sentence in enumerate(sentence_splitting.split(para), 1):
-            clean_lower = sentence.lower()
+    # Cleaning and POS tagging run in one batch for the whole document. With a
+    # progress listener they run per paragraph, so partial results keep coming in.
+    # Sentences already in the sentence cache skip both.
+    if progress:
+        batches = [list(batch) for _, batch in groupby(range(total_sentences), key=lambda i: sentences[i][0])]
+    else:
+        batches = [range(total_sentences)]
 
-            clean_accented = convert_accented_characters(clean_lower)
+    for batch in batches:
+        token_lists = tokenize_sentences_cached([sentences[i][2] for i in batch])
+        for i, tokens in zip(batch, token_lists):
+            p, s, sentence, start = sentences[i]
+            hierarchical_tokens.append(Sentence(p, s, start, start + len(sentence), tokens))
 
-            clean_html = remove_html_tags(clean_accented)
+            if progress:
+                progress(len(hierarchical_tokens), total_sentences, hierarchical_tokens[-1])
 
-            # Convert contractions before removing special characters for best results
-            clean_contractions = convert_contractions(clean_html)
+    return hierarchical_tokens
 
-            clean_special = remove_special_characters_and_numbers(clean_contractions)
 
-            # Tokenize text
-            clean_tokens = tokenizer.tokenize(clean_special)
+def tokenize_paragraphs(
+    paragraphs: Iterable[str],
+    alias_tsv_path: Optional[str] = "afinn_aliases.tsv"
+) -> list[Sentence]:
+    """
+    Tokenize a stream of paragraphs as they become available.
 
-            whitespace_tokens = [token.strip() for token in clean_tokens if token.strip()]
+    Same output as ``complete_tokenization`` on the paragraphs joined with
+    ``<br /><br />``, but each paragraph is tokenized as soon as the
+    iterable produces it, so it can be fed straight from an upload reader
+    without holding the whole document first.
 
-            # Fold multi-words with alias matching
-            folded_tokens, matches = fold_multiword_phrases_using_globals(
-                whitespace_tokens, alias_map
-            )
+    :param paragraphs: Raw paragraphs in document order.
+    :type paragraphs: Iterable[str]
 
-            # Applies stopword removal and lemmatization only for single-word tokens
-            singles = [t for t in folded_tokens if " " not in t]
+    :param alias_tsv_path: Optional path to TSV file containing alias
+                           mappings for multi-word phrases. Defaults to
+                           ``"afinn_aliases.tsv"``.
+    :type alias_tsv_path: str, optional
 
-            # While keeping order, compute lemmas for singles
-            singles_wo_stop = remove_stopwords(singles)
+    :return: A list of sentence records, see ``complete_tokenization``.
+    :rtype: list[Sentence]
+    """
+    ensure_alias_map(alias_tsv_path)
 
-            # Precompute lemmas once. use a deque for O(1) pops from the left
-            singles_lemmas = deque(lemmatize_text(singles_wo_stop))
+    return list(iter_tokenized_sentences(iter_paragraph_sentences(paragraphs)))
 
-            # Counts how many times each kept single should appear (preserve multiplicity)
-            keep_counts = Counter(singles_wo_stop)
 
-            #Rebuild the sequence of words in order keeping multi-word tokens as it is
-            clean_completed: List[str] = []
-            idx_single = 0
-            for tok in folded_tokens:
-                if " " in tok:
-                    clean_completed.append(tok)
-                else:
-                    # If the current single-word token is not a stopword and unused,
-                    # replace it with the next available lemma in the same positional order.
-                    # Checks multiplicity
-                    if idx_single < len(singles) and keep_counts[singles[idx_single]] > 0:
-                        clean_completed.append(singles_lemmas.popleft())
-                        keep_counts[singles[idx_single]] -= 1
-                    # advance original singles cursor
-                    idx_single += 1
+def iter_tokenization(
+    text: str,
+    alias_tsv_path: Optional[str] = "afinn_aliases.tsv"
+) -> Iterator[Sentence]:
+    """
+    Lazily tokenize text, yielding one sentence record at a time.
 
+    The generator counterpart of ``complete_tokenization``: the records are
+    the same, but a paragraph is only cleaned and tagged when its first
+    sentence is requested. Chained with ``sentiment_analysis.score_sentences``
+    it feeds the NDJSON stream, which sends the first scores before the
+    rest of the document is tokenized. The whole text is still held, and
+    the window functions need every record at once in a ``ScoredDocument``.
 
-            hierarchical_tokens.append({
-                "para": p,
-                "sentence": s,
-                "original": sentence,
-                "tokens": clean_completed
-            })
+    :param text: The full input string to tokenize.
+    :type text: str
 
-    return hierarchical_tokens
+    :param alias_tsv_path: Optional path to TSV file containing alias
+                           mappings for multi-word phrases. Defaults to
+                           ``"afinn_aliases.tsv"``.
+    :type alias_tsv_path: str, optional
+
+    :return: An iterator of sentence records, see
+             ``complete_tokenization``.
+    :rtype: Iterator[Sentence]
+    """
+    ensure_alias_map(alias_tsv_path)
+
+    yield from iter_tokenized_sentences(iter_sentences(text))
 
 
+def iter_tokenized_sentences(
+    sentences: Iterable[tuple[int, int, str, int]]
+) -> Iterator[Sentence]:
+    """
+    Tokenize numbered sentences, cleaning one paragraph at a time.
+
+    The sentences of a paragraph are cleaned and POS tagged in one batch
+    with ``tokenize_sentences_cached``, so streaming callers still only
+    wait for the current paragraph. The sentence texts are dropped once
+    tokenized; only their offsets are passed on.
+
+    :param sentences: ``(paragraph index, sentence index, sentence, start
+                      offset)`` tuples, e.g. from ``iter_sentences``.
+    :type sentences: Iterable[tuple[int, int, str, int]]
+
+    :return: An iterator of unscored ``Sentence`` records.
+    :rtype: Iterator[Sentence]
+    """
+    for _, paragraph in groupby(sentences, key=lambda item: item[0]):
+        paragraph = list(paragraph)
+        token_lists = tokenize_sentences_cached([sentence for _, _, sentence, _ in paragraph])
+        for (p, s, sentence, start), tokens in zip(paragraph, token_lists):
+            yield Sentence(p, s, start, start + len(sentence), tokens)
+
@@ -0,0 +1,189 @@
+from pathlib import Path
+from typing import Any, Optional
+import hashlib
+import json
+import os
+import threading
+import time
+from bounded_cache import BoundedCache
+from sentence_records import Document
+
+RESULT_STORE_DIR = Path(__file__).resolve().parent / "result_store"
+
+# Number of results kept in memory per worker process
+MEMORY_ITEMS = 64
+
+# Results on disk older than this are evicted (seconds)
+DISK_TTL_SECONDS = 24 * 60 * 60
+
+# Minimum time between two sweeps of the disk tier (seconds)
+SWEEP_INTERVAL_SECONDS = 10 * 60
+
+# Length of the hex digest used as the result id in URLs
+KEY_LENGTH = 32
+
+
+def document_key(content: str) -> str:
+    """
+    Compute the content address of a document.
+
+    The key is a truncated SHA-256 digest of the UTF-8 encoded text, so the
+    same upload always maps to the same stored result and the id stays short
+    enough to be carried in a redirect URL.
+
+    :param content: The full text of the uploaded document.
+    :type content: str
+
+    :return: A hexadecimal key identifying the document.
+    :rtype: str
+    """
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:KEY_LENGTH]
+
+
+class ResultStore:
+    """
+    Two-tier store for precomputed analysis results.
+
+    Results are kept in an in-memory LRU (``BoundedCache``) backed by JSON
+    files on disk. Disk entries expire after ``ttl_seconds`` and are swept
+    lazily while new results are written. A disk hit is promoted into the
+    memory tier so repeated page loads never touch the filesystem.
+    """
+
+    def __init__(
+        self,
+        directory: Path | str = RESULT_STORE_DIR,
+        memory_items: int = MEMORY_ITEMS,
+        ttl_seconds: float = DISK_TTL_SECONDS
+    ):
+        """
+        :param directory: Folder holding the on-disk tier.
+        :type directory: Path | str
+
+        :param memory_items: Capacity of the in-memory LRU tier.
+        :type memory_items: int
+
+        :param ttl_seconds: Age after which disk entries are evicted.
+        :type ttl_seconds: float
+        """
+        self.directory = Path(directory)
+        self.ttl_seconds = ttl_seconds
+        self.memory = BoundedCache(memory_items)
+        self._lock = threading.Lock()
+        self._last_sweep = 0.0
+
+    def _path(self, key: str) -> Path:
+        # Keys come from request arguments, only accept plain hex digests
+        if not key or not all(c in "0123456789abcdef" for c in key):
+            raise KeyError(key)
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Fetch a stored result by key.
+
+        :param key: The key returned by ``document_key``.
+        :type key: str
+
+        :return: The stored result, or ``None`` if it is missing or expired.
+        :rtype: Any | None
+        """
+        result = self.memory.get(key)
+        if result is not None:
+            return result
+
+        try:
+            path = self._path(key)
+            # Treat expired files as missing and remove them straight away
+            if time.time() - path.stat().st_mtime > self.ttl_seconds:
+                path.unlink(missing_ok=True)
+                return None
+            result = json.loads(path.read_text(encoding="utf-8"))
+        except (KeyError, OSError, ValueError):
+            return None
+
+        self.memory.put(key, result)
+        return result
+
+    def get_document(self, key: str) -> Optional[Document]:
+        """
+        Fetch a stored analysis result as a ``Document``.
+
+        :param key: The key returned by ``document_key``.
+        :type key: str
+
+        :return: The document, or ``None`` if it is missing, expired or was
+                 stored without sentence offsets by an older version.
+        :rtype: Document | None
+        """
+        result = self.get(key)
+        if result is None:
+            return None
+        try:
+            return Document.from_dict(result)
+        except ValueError:
+            return None
+
+    def put(self, key: str, result: Any) -> None:
+        """
+        Store a result in both tiers.
+
+        The file is written to a temporary name first and then renamed, so a
+        concurrent reader never sees a partially written result.
+
+        :param key: The key returned by ``document_key``.
+        :type key: str
+
+        :param result: A JSON serialisable result object.
+        :type result: Any
+
+        :return: None
+        :rtype: None
+        """
+        self.memory.put(key, result)
+
+        path = self._path(key)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        temp_path.write_text(json.dumps(result), encoding="utf-8")
+        os.replace(temp_path, path)
+
+        self.maybe_sweep()
+
+    def maybe_sweep(self) -> int:
+        """
+        Run ``evict_expired`` if the last sweep is older than
+        ``SWEEP_INTERVAL_SECONDS``.
+
+        :return: Number of files removed.
+        :rtype: int
+        """
+        with self._lock:
+            now = time.time()
+            if now - self._last_sweep < SWEEP_INTERVAL_SECONDS:
+                return 0
+            self._last_sweep = now
+        return self.evict_expired()
+
+    def evict_expired(self) -> int:
+        """
+        Delete every disk entry older than the TTL.
+
+        :return: Number of files removed.
+        :rtype: int
+        """
+        removed = 0
+        cutoff = time.time() - self.ttl_seconds
+        if not self.directory.exists():
+            return removed
+
+        for path in self.directory.glob("*.json"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    self.memory.pop(path.stem)
+                    removed += 1
+            # Another worker may have removed it already
+            except OSError:
+                continue
+        return removed
@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+from typing import Iterable
+import numpy as np
+from sentence_records import Sentence
+
+
+@dataclass(slots=True)
+class ScoredDocument:
+    """
+    Scored sentences of a document stored column by column.
+
+    One NumPy array per field, in document order, so the analysis functions
+    in ``sentiment_sentences``, ``sliding_window_fixed`` and
+    ``sliding_window_unfixed`` can work on whole columns at once instead of
+    reading every record. Like ``Sentence``, it keeps ``start``/``end``
+    offsets rather than the sentence text. Build it once with
+    ``from_sentences`` after ``compute_all_sentences``.
+    """
+
+    para: np.ndarray
+    sentence: np.ndarray
+    score: np.ndarray
+    token_count: np.ndarray
+    start: np.ndarray
+    end: np.ndarray
+
+    @classmethod
+    def from_sentences(cls, sentences: Iterable[Sentence]) -> "ScoredDocument":
+        """
+        Build the columns from scored sentence records.
+
+        Lazy iterables are read in full, as every column holds the whole
+        document.
+
+        :param sentences: Output of ``compute_all_sentences``.
+        :type sentences: Iterable[Sentence]
+
+        :return: The sentences as columns.
+        :rtype: ScoredDocument
+        """
+        sentences = list(sentences)
+        count = len(sentences)
+
+        def column(values, dtype) -> np.ndarray:
+            return np.fromiter(values, dtype=dtype, count=count)
+
+        return cls(
+            para=column((line.para for line in sentences), np.int64),
+            sentence=column((line.sentence for line in sentences), np.int64),
+            score=column((line.score for line in sentences), np.float64),
+            token_count=column((len(line.tokens) for line in sentences), np.int64),
+            start=column((line.start for line in sentences), np.int64),
+            end=column((line.end for line in sentences), np.int64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.score)
+
+    def text(self, index: int, document: str) -> str:
+        """
+        Return the original text of the sentence at a position.
+
+        :param index: Position of the sentence in the document.
+        :type index: int
+
+        :param document: The text the sentences were tokenized from.
+        :type document: str
+
+        :return: The original sentence text.
+        :rtype: str
+        """
+        return document[self.start[index]:self.end[index]]
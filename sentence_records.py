@@ -0,0 +1,109 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass(slots=True)
+class Sentence:
+    """
+    One tokenized sentence of a document.
+
+    Produced by the tokenizers in ``preprocessing`` and scored in place by
+    ``sentiment_analysis``. The record holds ``start``/``end`` offsets into
+    the document instead of a copy of the sentence, see ``sentence_text``.
+    Slots keep it to a few machine words plus the token list, and fields
+    are plain attribute reads in the analysis loops.
+    """
+
+    para: int
+    sentence: int
+    start: int
+    end: int
+    tokens: list[str]
+    score: float = 0.0
+
+    def to_dict(self, document: Optional[str] = None) -> dict:
+        """
+        Convert the record to a JSON friendly dictionary.
+
+        :param document: The text the record was tokenized from. When
+                         given, the sentence text is included under
+                         ``"original"``.
+        :type document: str, optional
+
+        :return: ``{"para", "sentence", "span", "tokens", "score"}``, plus
+                 ``"original"`` if a document was given.
+        :rtype: dict
+        """
+        data = {
+            "para": self.para,
+            "sentence": self.sentence,
+            "span": [self.start, self.end],
+            "tokens": self.tokens,
+            "score": self.score,
+        }
+        if document is not None:
+            data["original"] = document[self.start:self.end]
+        return data
+
+
+@dataclass(slots=True)
+class Document:
+    """
+    A document text together with its sentence records.
+
+    This is what the result store keeps; ``to_dict`` and ``from_dict`` are
+    its JSON boundary.
+    """
+
+    text: str
+    sentences: list[Sentence] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        """
+        Convert the document to a JSON friendly dictionary.
+
+        :return: ``{"content": text, "sentences": [...]}`` with the
+                 sentences as from ``Sentence.to_dict``.
+        :rtype: dict
+        """
+        return {"content": self.text, "sentences": [sentence.to_dict() for sentence in self.sentences]}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Document":
+        """
+        Rebuild a document from ``to_dict`` output.
+
+        :param data: ``{"content", "sentences"}`` dictionary.
+        :type data: dict
+
+        :return: The document with its sentence records.
+        :rtype: Document
+
+        :raises ValueError: If a sentence has no ``"span"`` offsets.
+        """
+        sentences = []
+        for item in data["sentences"]:
+            if "span" not in item:
+                raise ValueError("Stored sentence has no span offsets")
+            start, end = item["span"]
+            sentences.append(Sentence(item["para"], item["sentence"], start, end,
+                                      item["tokens"], item.get("score", 0.0)))
+        return cls(data["content"], sentences)
+
+
+def sentence_text(line: Sentence, document: str) -> str:
+    """
+    Return the original text of a sentence record.
+
+    The text is only sliced out of the document where it is displayed.
+
+    :param line: A sentence record, e.g. from ``complete_tokenization``.
+    :type line: Sentence
+
+    :param document: The text the record was tokenized from.
+    :type document: str
+
+    :return: The original sentence text.
+    :rtype: str
+    """
+    return document[line.start:line.end]
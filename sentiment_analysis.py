@@ -1,4 +1,11 @@
+from typing import Iterable, Iterator
 from afinn_loader import get_afinn
+from sentence_records import Sentence
+
+# Sentence averages are rounded to this many decimals and then divided by 5,
+# so every sentence score is a whole multiple of SCORE_STEP
+SCORE_DECIMALS = 5
+SCORE_STEP = 10 ** -SCORE_DECIMALS / 5
 
 def get_sentence_score(afinn: dict, tokenized_sentence: dict) -> float:
     """
@@ -27,7 +34,7 @@ def get_sentence_score(afinn: dict, tokenized_sentence: dict) -> float:
     if tokens_word_count == 0:
         score = 0
     else:
-        score = round(score / tokens_word_count, 5)
+        score = round(score / tokens_word_count, SCORE_DECIMALS)
 
     # rescale score so that the max range is -1 to 1 instead of -5 to 5
     rescaled_score = score / 5
@@ -35,53 +42,72 @@ def get_sentence_score(afinn: dict, tokenized_sentence: dict) -> float:
     return rescaled_score
 
 
-def add_score_to_dict(sentences_list: list[dict], score_list: list) -> list[dict]:
+def add_score_to_dict(sentences_list: list[Sentence], score_list: list) -> list[Sentence]:
     """
-    add sentiment score to each dictionary in the list of dictionaries
+    add sentiment score to each sentence record in the list
 
-    :params sentences_list: the list containing dictionaries where the function will add scores to
-    :type sentences_list: list[dict]
+    :params sentences_list: the list containing sentence records where the function will add scores to
+    :type sentences_list: list[Sentence]
 
-    :params score_list: the list of scores to add to each dictionary
+    :params score_list: the list of scores to add to each record
     :type score_list: list
 
-    :returns: updated list of dictionaries containing scores for each sentence
-    :rtype: list[dict]
+    :returns: updated list of sentence records containing scores for each sentence
+    :rtype: list[Sentence]
     """
 
-    for index, sentence_dict in enumerate(sentences_list):
+    for index, sentence in enumerate(sentences_list):
         current_score = score_list[index]
-        sentence_dict["score"] = current_score
+        sentence.score = current_score
 
     return sentences_list
 
 
-def compute_all_sentences(sentences_list: list[dict]) -> list[dict]:
+def compute_all_sentences(sentences_list: list[Sentence]) -> list[Sentence]:
     """
-    computes all the sentiment score of the sentence dictionary in the list
+    computes all the sentiment score of the sentence records in the list
     and output the score.
 
-    :params sentences_list: the list of dictionaries containing the sentences used to compute the sentiment score
-    :type sentences_list: list[dict]
+    :params sentences_list: the list of sentence records used to compute the sentiment score
+    :type sentences_list: list[Sentence]
 
-    :returns: the same sentences_list but with scoring in each dictionary
-    :rtype: list[dict]
+    :returns: the same sentences_list but with scoring in each record
+    :rtype: list[Sentence]
     """
     afinn = get_afinn()
     score_list = []
 
-    for sentence_dict in sentences_list:
-        tokenized_sentence = sentence_dict['tokens']
+    for sentence in sentences_list:
+        tokenized_sentence = sentence.tokens
 
         score = get_sentence_score(afinn, tokenized_sentence)
         score_list.append(score)
 
-    modified_dict = add_score_to_dict(sentences_list, score_list)
+    modified_sentences = add_score_to_dict(sentences_list, score_list)
+
+    return modified_sentences
+
+
+def score_sentences(sentences: Iterable[Sentence]) -> Iterator[Sentence]:
+    """
+    adds the sentiment score to each sentence record as it arrives
+    and yields it, the lazy version of compute_all_sentences.
+
+    :params sentences: the sentence records to score, e.g. from iter_tokenization
+    :type sentences: Iterable[Sentence]
+
+    :returns: the same records with scoring, one at a time
+    :rtype: Iterator[Sentence]
+    """
+    afinn = get_afinn()
 
-    return modified_dict
+    for sentence in sentences:
+        sentence.score = get_sentence_score(afinn, sentence.tokens)
+        yield sentence
 
 
 if __name__ == "__main__":
-    sentences = [{'para': 1, 'sentence': 1, 'original': "***May Contain Spoilers*** OK, it wasn't exactly as good as expected in fact it was a lot different than I had thought it would be but it still turned out to be a pretty good movie.", 'tokens': 'may contain spoilers ok not exactly good expected in fact lot different thought would still turned pretty good movie'}, {'para': 2, 'sentence': 1, 'original': "I usually don't care too much for that type of music but in this movie it worked perfectly (I mean duh he's a rock star) but anyway I loved Stuart Townsend in this, and Aaliyah, although she had a small part in the movie was amazing.", 'tokens': ['usually', 'not', 'care', 'much', 'type', 'of', 'music', 'in', 'movie', 'worked', 'perfectly', 'mean', 'duh', 'rock', 'star', 'anyway', 'loved', 'stuart', 'townsend', 'in', 'aaliyah', 'although', 'small', 'part', 'in', 'movie', 'amazing']}, 
-    {'para': 2, 'sentence': 1, 'original': ",,,", 'tokens': []}]
-    print(compute_all_sentences(sentences))
\ No newline at end of file
+    sentences = [Sentence(1, 1, 0, 185, 'may contain spoilers ok not exactly good expected in fact lot different thought would still turned pretty good movie'.split()),
+                 Sentence(2, 1, 197, 429, ['usually', 'not', 'care', 'much', 'type', 'of', 'music', 'in', 'movie', 'worked', 'perfectly', 'mean', 'duh', 'rock', 'star', 'anyway', 'loved', 'stuart', 'townsend', 'in', 'aaliyah', 'although', 'small', 'part', 'in', 'movie', 'amazing']),
+                 Sentence(2, 2, 430, 433, [])]
+    print(compute_all_sentences(sentences))
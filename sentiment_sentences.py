@@ -1,51 +1,83 @@
-def most_positive_sentence(scored_text: list[dict]) -> tuple[float, str] | str:
+from typing import Callable
+import numpy as np
+from scored_document import ScoredDocument
+
+
+def extreme_sentences(
+    scored_text: ScoredDocument,
+    best: Callable[[np.ndarray], np.floating],
+    document: str
+) -> tuple[float, str] | str:
     """
-    This function identifies the sentence with the highest sentiment score in the entire text
+    This function finds the best score of the text and every sentence with that score
 
-    :param scored_text: output of the text after sentiment analysis
-    :type scored_text: list[dict]
+    Only sentences with tokenized words compete for the best score, but every sentence that ties
+    with it is included (a sentence without tokens scores 0). Works on the score column of the
+    whole text at once; only the winning sentences are sliced out of the document.
 
-    :returns: tuple of the score and sentence of the most positive sentence
-              or an error message if an exception occurred
+    :param scored_text: the scored sentences as columns
+    :type scored_text: ScoredDocument
+
+    :param best: reduces an array of scores to the best one, e.g. np.max
+    :type best: Callable[[np.ndarray], np.floating]
+
+    :param document: the text the sentences were tokenized from
+    :type document: str
+
+    :returns: tuple of the best score and its sentences joined with \n
+              or an error message if no sentence could be scored
     :rtype: tuple[float, str] | str
     """
 
     try:
-        # Retrieve all the score and skip the sentence if it does not have any tokenized word to be scored
-        score_list = [line['score'] for line in scored_text if line['tokens'] != []]
-        max_score = max(score_list)
-        # Retrieve all sentences that have this max score
-        max_sentences = [line['original'] for line in scored_text if line['score'] == max_score]
-        # Combine the max sentences with \n
-        combined_sentence = '\n'.join(max_sentences)
+        scores = scored_text.score
+        # Skip the sentences that do not have any tokenized word to be scored
+        candidates = scores[scored_text.token_count > 0]
+
+        if len(candidates) == 0:
+            return ("Insufficient sentences available")
 
-        return (max_score, combined_sentence)
+        best_score = best(candidates)
+        # Retrieve all sentences that have this score
+        best_positions = np.flatnonzero(scores == best_score)
+
+        # Combine the best sentences with \n
+        return (float(best_score), '\n'.join(scored_text.text(index, document) for index in best_positions))
 
     except:
         return ("Insufficient sentences available")
 
 
-def most_negative_sentence(scored_text: list[dict]) -> tuple[float, str] | str:
+def most_positive_sentence(scored_text: ScoredDocument, document: str) -> tuple[float, str] | str:
     """
-    This function identifies the sentence with the lowest sentiment score in the entire text
+    This function identifies the sentence with the highest sentiment score in the entire text
 
-    :param scored_text: output of the text after sentiment analysis
-    :type scored_text: list[dict]
+    :param scored_text: output of the text after sentiment analysis, see ScoredDocument.from_sentences
+    :type scored_text: ScoredDocument
 
-    :returns: tuple of the score and sentence of the most negative sentence or string if an error occurred
+    :param document: the text the sentences were tokenized from
+    :type document: str
+
+    :returns: tuple of the score and sentence of the most positive sentence
+              or an error message if an exception occurred
     :rtype: tuple[float, str] | str
     """
 
-    try:
-        # Retrieve all the score and skip the sentence if it does not have any tokenized word to be scored
-        score_list = [line['score'] for line in scored_text if line['tokens'] != []]
-        min_score = min(score_list)
-        # Retrieve all sentences that have this min score
-        min_sentences = [line['original'] for line in scored_text if line['score'] == min_score]
-        # Combine the min sentences with \n
-        combined_min_sentence = '\n'.join(min_sentences)
+    return extreme_sentences(scored_text, np.max, document)
 
-        return (min_score, combined_min_sentence)
 
-    except:
-        return ("Insufficient sentences available")
\ No newline at end of file
+def most_negative_sentence(scored_text: ScoredDocument, document: str) -> tuple[float, str] | str:
+    """
+    This function identifies the sentence with the lowest sentiment score in the entire text
+
+    :param scored_text: output of the text after sentiment analysis, see ScoredDocument.from_sentences
+    :type scored_text: ScoredDocument
+
+    :param document: the text the sentences were tokenized from
+    :type document: str
+
+    :returns: tuple of the score and sentence of the most negative sentence or string if an error occurred
+    :rtype: tuple[float, str] | str
+    """
+
+    return extreme_sentences(scored_text, np.min, document)
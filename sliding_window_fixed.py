@@ -1,126 +1,53 @@
-def total_sentences(text: list[dict]) -> int:
-    """
-    Determine the number of sentences in the text
+import numpy as np
+from scored_document import ScoredDocument
 
-    :param text: a list of dictionaries containing the sentences
-    :type text: list[dict]
 
-    :returns: total number of sentences
-    :rtype: int
+def window_scores(scored_text: ScoredDocument) -> tuple[np.ndarray, np.ndarray]:
     """
+    Slides a window of 3 consecutive sentences over the whole text at once.
+    Only windows where all 3 sentences are of the same paragraph and have tokens are kept.
 
-    num_of_sentences = len(text)
-
-    return num_of_sentences
+    Window i holds sentences i, i + 1 and i + 2. The columns are shifted against each other
+    to test every window and add up its scores in one go. The sentences are not joined here.
 
+    :param scored_text: the scored sentences as columns
+    :type scored_text: ScoredDocument
 
-def sliding(scored_text: list[dict]) -> list[tuple[str, float]] | None:
+    :returns: the position of the first sentence of each window and the combined score of each window
+    :rtype: tuple[np.ndarray, np.ndarray]
     """
-    Performs the sliding of the window with 3 sentences in each window. 
-    Where all 3 sentences have to be of the same paragraph.
 
-    :param scored_text: output of the text after sentiment analysis
-    :type scored_text: list[dict]
+    if len(scored_text) < 3:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
 
-    :returns: a list containing the pairs of sentences in window and their combined score for each window
-              or None if an exception occurred
-    :rtype: list[tuple[str, float]] | None
-    """
+    # first, second and third refers to the
+    # first, second and third element in the sliding window
+    has_tokens = scored_text.token_count > 0
+    para = scored_text.para
+    score = scored_text.score
 
-    # window_list will store the sentences and sum of the score for the 3 sentences in the window
-    window_list = []
-    sentence_para = 0
-    try:
-        # Check that there is a 3rd sentence within the text
-        while sentence_para + 2 < total_sentences(scored_text):
-            # first, second and third refers to the 
-            # first, second and third element in the sliding window
-            first = scored_text[sentence_para]
-            second = scored_text[sentence_para + 1]
-            third = scored_text[sentence_para + 2]
-            # Identify the paragraph num of the first sentence
-            para_number = first["para"]
-
-            # Move window by 1 to the next sentence if any of the 3 sentences in the current window is blank
-            if (first["tokens"] == [] or
-                    second["tokens"] == [] or
-                    third["tokens"] == []):
-                sentence_para += 1
-
-            # Ensures that all 3 sentences are from the same paragraph
-            # Compare second and third sentences' para number to first sentence para number
-            elif (second["para"] == para_number and
-                  third["para"] == para_number):
-
-                # Combine the 3 sentences in this window into one
-                sentence_segment = " ".join([first["original"], second["original"], third["original"]])
-                # Add the scores of the 3 sentences tgt
-                temp_score = first["score"] + second["score"] + third["score"]
-                # Add the sentences and total score in the current segment to a temporary list
-                window_list.append([sentence_segment, temp_score])
-                sentence_para += 1
-
-            # Move to the next sentence if it does not fulfil the above conditions
-            else:
-                sentence_para += 1
-
-        # Return the temporary list if it is not empty, else return None
-        if window_list != []:
-            return window_list
-
-        else:
-            return None
+    # All 3 sentences have tokens and are from the same paragraph
+    valid = (has_tokens[:-2] & has_tokens[1:-1] & has_tokens[2:] &
+             (para[1:-1] == para[:-2]) & (para[2:] == para[:-2]))
+    positions = np.flatnonzero(valid)
 
-    except:
-        return None
+    # Add the scores of the 3 sentences tgt
+    temp_scores = score[positions] + score[positions + 1] + score[positions + 2]
+    return positions, temp_scores
 
 
-def positive_segment(window_score: list[list]) -> list[tuple[list[str], float]]:
+def sliding_window(scored_text: ScoredDocument, document: str) -> list[tuple[list[str], float]] | str:
     """
-    Identify the segment with the highest sentiment score and the sentences in that segment
-
-    :param window_score: results of the sliding window which contains the sentences and score of each window
-    :type window_score: list[list]
+    Find the windows of 3 sentences with the highest and lowest combined score
 
-    :returns: a list containing the sentences and total score of the most positive segment
-    :rtype: list[tuple[list[str], float]
-    """
+    The scores of all windows come from window_scores and the highest and lowest ones
+    are picked out of that array. Only the sentences of the winning windows are joined.
 
-    # Retrieve the highest sentiment score
-    most_positive_score = max(segment[1] for segment in window_score)
-    # Retrieve the segments that has the highest score
-    most_positive_sentences = [segment[0] for segment in window_score
-                               if segment[1] == most_positive_score]
+    :param scored_text: output of the text after sentiment analysis, see ScoredDocument.from_sentences
+    :type scored_text: ScoredDocument
 
-    return [most_positive_sentences, most_positive_score]
-
-
-def negative_segment(window_score: list[list]) -> list[tuple[list[str], float]]:
-    """
-    Identify the segment with the lowest sentiment score and the sentences in that segment
-
-    :param window_score: results of the sliding window which contains the sentences and score of each window
-    :type window_score: list[list]
-
-    :returns: a list containing the sentences and total score of the most negative segment
-    :rtype: list[tuple[list[str], float]
-    """
-
-    # Retrieve the lowest sentiment score
-    most_negative_score = min(segment[1] for segment in window_score)
-    # Retrieve the segments that has the lowest score
-    most_negative_sentences = [segment[0] for segment in window_score
-                               if segment[1] == most_negative_score]
-
-    return [most_negative_sentences, most_negative_score]
-
-
-def sliding_window(scored_text: list[dict]) -> list[tuple[list[str], float]] | str:
-    """
-    Combine the sliding window function with the most positive and negative segment function
-
-    :param scored_text: output of the text after sentiment analysis
-    :type scored_text: list[dict]
+    :param document: the text the sentences were tokenized from
+    :type document: str
 
     :returns: a list with 2 tuples containing the sentences and total score of the most positive segment
               followed by the sentences and total score of the most negative segment
@@ -128,13 +55,23 @@ def sliding_window(scored_text: list[dict]) -> list[tuple[list[str], float]] | s
     :rtype: list[tuple[list[str], float]] or str
     """
 
-    result = sliding(scored_text)
-    if result is None:
-        # No segment calculated due to insuffient sentences in the window
-        return "Unable to calculate sliding window"
+    try:
+        positions, temp_scores = window_scores(scored_text)
+
+        if len(positions) == 0:
+            # No segment calculated due to insuffient sentences in the window
+            return "Unable to calculate sliding window"
 
-    else:
-        most_positive_segment = positive_segment(result)
-        most_negative_segment = negative_segment(result)
+        segments = []
+        # Keep every segment that ties with the highest or lowest score
+        for best_score in (temp_scores.max(), temp_scores.min()):
+            segments.append([
+                [" ".join(scored_text.text(index, document) for index in range(first, first + 3))
+                 for first in positions[temp_scores == best_score].tolist()],
+                float(best_score),
+            ])
 
-        return [most_positive_segment, most_negative_segment]
\ No newline at end of file
+        return segments
+
+    except:
+        return "Unable to calculate sliding window"
@@ -1,125 +1,107 @@
-from sliding_window_fixed import total_sentences
+import numpy as np
+from scored_document import ScoredDocument
+from sentiment_analysis import SCORE_DECIMALS, SCORE_STEP
 
 
-def update_segment(scored_text: list[dict], start_pos: int, end_pos: int, temp_score: float) -> dict[str, str | float]:
+def segment_starts(prefix: np.ndarray, new_para: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
     """
-    This function combines the sentences in the current continuous segment and
-    the total score into a dictionary based on the range of the segment provided
+    Running minimum of the prefix sums within each paragraph and where it was first reached.
 
-    :param scored_text: output of the text after sentiment analysis
-    :param start_pos: The starting sentence position in the current segment
-    :param end_pos: The ending sentence position in the current segment
-    :param temp_score: Total score of the segment
+    np.minimum.accumulate cannot restart at every paragraph, so each paragraph is shifted
+    below all the paragraphs before it first: its running minimum then never looks back
+    past its own start. The shifts are sums of whole numbers, so nothing is rounded.
 
-    :type scored_text: list[dict]
-    :type start_pos: int
-    :type end_pos: int
-    :type temp_score: float
+    :param prefix: for each sentence, the sum of the scores before it in its paragraph (0 for the first)
+    :type prefix: np.ndarray
 
-    :returns: The combined sentences and score of the current segment
-    :rtype: dict[str, str | float] 
+    :param new_para: True for the first sentence of each paragraph
+    :type new_para: np.ndarray
+
+    :returns: the running minimum of prefix in the paragraph, and the position of the sentence
+              where that minimum was first reached
+    :rtype: tuple[np.ndarray, np.ndarray]
     """
 
-    updated_segment = {'sentence': " ".join(scored_text[line]['original'] for line in range(start_pos, end_pos + 1)),
-                       'score': temp_score}
+    positions = np.arange(len(prefix))
+    para_starts = np.flatnonzero(new_para)
+    para_of = np.cumsum(new_para) - 1
+
+    # Every paragraph starts at 0, so its minimum is never positive
+    para_min = np.minimum.reduceat(prefix, para_starts)
+    shift = np.concatenate(([0], np.cumsum(para_min)[:-1]))[para_of]
+
+    shifted = prefix + shift
+    running_min = np.minimum.accumulate(shifted)
+
+    # A segment restarts where the prefix drops below its running minimum, and at every new paragraph
+    restart = new_para.copy()
+    restart[1:] |= shifted[1:] < running_min[:-1]
+    start = np.maximum.accumulate(np.where(restart, positions, 0))
 
-    return updated_segment
+    return running_min - shift, start
 
 
-def sliding_window_2(scored_text: list[dict]) -> list[list[dict[str, float]]] | str:
+def sliding_window_2(scored_text: ScoredDocument, document: str) -> list[list[dict[str, float]]] | str:
     """
     Finds the most positive and most negative sentence segments using a sliding window approach.
     A fixed window is not set for this function.
 
-    :param scored_text: output of the text after sentiment analysis
-    :type scored_text: list[dict]
+    The best segment ending at a sentence is the sum of the paragraph's scores up to it minus the
+    lowest sum before it (the highest for the most negative segment), so every segment is scored
+    at once from prefix sums. Scores are whole multiples of SCORE_STEP and are summed as integer
+    counts of it, so there is no rounding error: segments tie exactly when their scores are equal,
+    and a running total that comes to exactly 0 does not restart. Only the winning segments are joined.
+
+    :param scored_text: output of the text after sentiment analysis, see ScoredDocument.from_sentences
+    :type scored_text: ScoredDocument
+
+    :param document: the text the sentences were tokenized from
+    :type document: str
 
     :returns: the most positive segments and the most negative segments
               Or a string error message if processing fails.
-    :rtype: list[list[dict[str, float]]] | str 
+    :rtype: list[list[dict[str, float]]] | str
     """
 
     try:
-        para_pos = 0
-        max_segments = []
-        min_segments = []
-        length = total_sentences(scored_text)
-
-        # -inf is the maximum negative value
-        max_score = float('-inf')
-        # inf is the maximum positive value
-        min_score = float('inf')
-
-        while para_pos < length:
-            para_number = scored_text[para_pos]['para']
-            line_pos = para_pos
-            max_temp_score = float('-inf')
-            min_temp_score = float('inf')
-
-            # Position of the first line of the current para
-            max_start = para_pos
-            min_start = para_pos
-
-            # If current line is from the same paragraph as the previous line, otherwise exit this loop and continue in the outside loop
-            while line_pos < length and scored_text[line_pos]['para'] == para_number:
-                current_score = scored_text[line_pos]["score"]
-
-                # If token is blank then skip to the next line and start from the current while loop again
-                if not scored_text[line_pos]["tokens"]:
-                    line_pos += 1
-                    continue
-
-                # Max scoring logic:
-                # If existing scoring is negative then there is no need to add the current score because it will make it more negative
-                # negative + negative = negative, negative + positive = negative
-                # To checks if maxtempscore > maxtempscore + current e.g. 3 > 3+(-2) = 3 >-2 true, else 3 > 3+2 = 3 > 5 false
-                # If maxtempscore > maxtempscore + current then we do not want to the current negative score
-
-                if max_temp_score < 0:
-                    max_temp_score = current_score
-                    max_start = line_pos
-
-                # If the existing scoring is not negative then add the current score to the existing scoring
-                else:
-                    max_temp_score += current_score
-
-                # Check maxtempscore in the current segment is more the most max score found
-                # Identify the current segment by getting the start position of the segment and end position which is the current position
-                if max_temp_score > max_score:
-                    max_score = max_temp_score
-                    max_segments = [update_segment(scored_text, max_start, line_pos, max_temp_score)]
-
-                elif max_temp_score == max_score:
-                    max_segments.append(update_segment(scored_text, max_start, line_pos, max_temp_score))
-
-                # Min scoring logic:
-                # If positive min temp score is added to the current score it will cause it to be more positive
-                # If mintempscore < mintempscore + current then we do not want to add the current positive score
-                if min_temp_score > 0:
-                    min_temp_score = current_score
-                    min_start = line_pos
-
-                # If the existing scoring is not positive then add the current score to the existing scoring
-                else:
-                    min_temp_score += current_score
-
-                # Compare mintempscore which is the score for the current segment against the most min score found
-                if min_temp_score < min_score:
-                    min_score = min_temp_score
-                    min_segments = [update_segment(scored_text, min_start, line_pos, min_temp_score)]
-
-                elif min_temp_score == min_score:
-                    min_segments.append(update_segment(scored_text, min_start, line_pos, min_temp_score))
-
-                # If scoring is not more than the max score and not less than the min score then move on the next line
-                line_pos += 1
-
-            # If line is in the next para then update the para pos to the current line pos
-            para_pos = line_pos
-        if max_segments == [] and min_segments == []:
+        # Blank lines are skipped, they never start or end a segment
+        lines = np.flatnonzero(scored_text.token_count > 0)
+        if len(lines) == 0:
             return "Unable to calculate sliding window"
-        else:
-            return [max_segments, min_segments]
+
+        # Segments never cross paragraphs
+        para = scored_text.para[lines]
+        new_para = np.ones(len(lines), dtype=bool)
+        new_para[1:] = para[1:] != para[:-1]
+
+        steps = np.rint(scored_text.score[lines] / SCORE_STEP).astype(np.int64)
+        # Sum of the scores before each line in its paragraph
+        before = np.cumsum(steps) - steps
+        before -= before[np.maximum.accumulate(np.where(new_para, np.arange(len(lines)), 0))]
+        upto = before + steps
+
+        # Max scoring logic: the running total restarts once it has gone negative,
+        # i.e. at the lowest sum of scores before the current line
+        lowest, max_start = segment_starts(before, new_para)
+        max_temp_score = upto - lowest
+
+        # Min scoring logic: restarts once it has gone positive, at the highest sum before the line
+        negated_highest, min_start = segment_starts(-before, new_para)
+        min_temp_score = upto + negated_highest
+
+        def segments(temp_scores, starts, best):
+            best_score = best(temp_scores)
+            # Every segment that ties with the best score, in text order
+            found = []
+            for end in np.flatnonzero(temp_scores == best_score).tolist():
+                start_pos, end_pos = lines[starts[end]], lines[end]
+                found.append({'sentence': " ".join(scored_text.text(line, document)
+                                                   for line in range(start_pos, end_pos + 1)),
+                              'score': round(int(best_score) * SCORE_STEP, SCORE_DECIMALS + 1)})
+            return found
+
+        return [segments(max_temp_score, max_start, np.max),
+                segments(min_temp_score, min_start, np.min)]
 
     except:
-        return "Unable to calculate sliding window"
\ No newline at end of file
+        return "Unable to calculate sliding window"
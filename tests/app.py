@@ -0,0 +1,158 @@
+import io
+import json
+import tempfile
+import time
+import unittest
+from unittest import mock
+import app as app_module
+from analysis import prepare_text, analyze_text, summarize
+from jobs import JobManager
+from result_store import ResultStore
+import worker_pool
+
+DOCUMENT = "What a great film. The ending was awful!<br /><br />I would watch it again."
+
+
+class AppTestCase(unittest.TestCase):
+    def setUp(self):
+        # Keep results out of the shared result_store folder
+        self.tmp = tempfile.TemporaryDirectory()
+        store = ResultStore(self.tmp.name)
+        for name, value in (("result_store", store), ("job_manager", JobManager(store))):
+            patcher = mock.patch.object(app_module, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+        self.client = app_module.app.test_client()
+
+    def expected_summary(self, text, detail=False):
+        content = prepare_text(text)
+        return summarize(analyze_text(content, parallel=False), content, detail=detail)
+
+
+class TestAnalyzeApi(AppTestCase):
+    def test_json_raw_and_upload_bodies(self):
+        expected = self.expected_summary(DOCUMENT)
+        bodies = {
+            "json": dict(json={"text": DOCUMENT}),
+            "raw": dict(data=DOCUMENT.encode("utf-8"), content_type="text/plain"),
+            "upload": dict(data={"file": (io.BytesIO(DOCUMENT.encode("utf-8")), "review.txt")}),
+        }
+        for name, body in bodies.items():
+            with self.subTest(name):
+                response = self.client.post("/api/analyze", **body)
+                self.assertEqual(response.status_code, 200, "a valid body should be analysed")
+                self.assertEqual(response.get_json(), expected, "the API should return the summary of the text")
+
+    def test_bad_bodies(self):
+        response = self.client.post("/api/analyze", json={"content": DOCUMENT})
+        self.assertEqual(response.status_code, 400, "JSON without a text string should be rejected")
+        response = self.client.post("/api/analyze", data={"file": (io.BytesIO(b"text"), "review.csv")})
+        self.assertEqual(response.get_json(), {"error": "Please upload a .txt file"}, "only .txt uploads are accepted")
+
+    def test_upload_limit(self):
+        with mock.patch.object(app_module, "MAX_UPLOAD_BYTES", 10):
+            response = self.client.post("/api/analyze", data=DOCUMENT.encode("utf-8"), content_type="text/plain")
+        self.assertEqual(response.status_code, 413, "bodies over MAX_UPLOAD_BYTES should be rejected")
+
+
+class TestStreamApi(AppTestCase):
+    def test_ndjson_lines(self):
+        response = self.client.post("/api/analyze/stream", json={"text": DOCUMENT})
+        self.assertEqual(response.mimetype, "application/x-ndjson", "scores should be streamed as NDJSON")
+        lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+        expected = self.expected_summary(DOCUMENT, detail=True)["sentences"]
+        self.assertEqual(lines, [{"para": line["para"], "sentence": line["sentence"], "score": line["score"],
+                                  "token_count": len(line["tokens"])} for line in expected],
+                         "one line per sentence with the same scores as /api/analyze")
+
+    def test_bad_body(self):
+        response = self.client.post("/api/analyze/stream", data=b"   ", content_type="text/plain")
+        self.assertEqual(response.get_json(), {"error": "Request body is empty"}, "empty bodies should be rejected")
+
+
+class TestBatchApi(AppTestCase):
+    @classmethod
+    def setUpClass(cls):
+        # One spawned worker is enough to go through the real pool
+        cls.workers = mock.patch.object(worker_pool, "ANALYSIS_WORKERS", 1)
+        cls.workers.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        worker_pool.shutdown_process_pool()
+        cls.workers.stop()
+
+    def test_array_and_ndjson_bodies(self):
+        texts = [DOCUMENT, "Nothing to see here.", "Terrible. Just terrible."]
+        expected = [self.expected_summary(text) for text in texts]
+
+        response = self.client.post("/api/batch", json=[texts[0], {"text": texts[1]}, texts[2]])
+        self.assertEqual(response.get_json(), expected, "results should come back in input order")
+
+        body = "\n".join(json.dumps(text) for text in texts) + "\n\n"
+        response = self.client.post("/api/batch", data=body, content_type="application/x-ndjson")
+        self.assertEqual(response.mimetype, "application/x-ndjson", "NDJSON input should be answered with NDJSON")
+        self.assertEqual([json.loads(line) for line in response.get_data(as_text=True).splitlines()], expected,
+                         "one result line per document, in input order")
+
+    def test_bad_documents(self):
+        response = self.client.post("/api/batch", json={"text": DOCUMENT})
+        self.assertEqual(response.get_json(), {"error": "JSON body must be an array of documents"},
+                         "a single object is not a batch")
+        response = self.client.post("/api/batch", json=[DOCUMENT, 3])
+        self.assertEqual(response.status_code, 400, "every document must be a string or have a text string")
+
+
+class TestJobsApi(AppTestCase):
+    def wait_for(self, job_id):
+        deadline = time.time() + 60
+        while time.time() < deadline:
+            status = self.client.get(f"/api/jobs/{job_id}").get_json()
+            if status["status"] in ("done", "failed"):
+                return status
+            time.sleep(0.05)
+        self.fail("job did not finish")
+
+    def test_job_result_and_partial_scores(self):
+        response = self.client.post("/api/jobs", json={"text": DOCUMENT})
+        self.assertEqual(response.status_code, 202, "jobs should be accepted straight away")
+        job_id = response.get_json()["id"]
+
+        status = self.wait_for(job_id)
+        self.assertEqual(status["status"], "done", "the job should succeed")
+        expected = self.expected_summary(DOCUMENT)
+        self.assertEqual((status["processed"], status["total"]), (len(expected["sentences"]),) * 2,
+                         "every sentence should be counted")
+        self.assertEqual(app_module.job_manager.get(job_id).scores, expected["sentences"],
+                         "partial scores should be the final sentence scores")
+        self.assertEqual(self.client.get(status["result_url"]).get_json(), expected,
+                         "the job result should be the /api/analyze summary")
+
+    def test_event_stream(self):
+        job_id = self.client.post("/api/jobs", json={"text": DOCUMENT}).get_json()["id"]
+        response = self.client.get(f"/api/jobs/{job_id}/events")
+        self.assertEqual(response.mimetype, "text/event-stream", "events should be sent as Server-Sent Events")
+
+        events = []
+        for block in response.get_data(as_text=True).strip().split("\n\n"):
+            event, data = block.split("\n")
+            events.append((event.removeprefix("event: "), json.loads(data.removeprefix("data: "))))
+
+        sentences = self.expected_summary(DOCUMENT)["sentences"]
+        self.assertEqual([data for event, data in events if event == "sentence"],
+                         [{**line, "processed": i, "total": len(sentences)} for i, line in enumerate(sentences, 1)],
+                         "every sentence score should be sent once, in order")
+        self.assertEqual([(data["para"], data["sentences"]) for event, data in events if event == "paragraph"],
+                         [(1, 2), (2, 1)], "a paragraph event should follow the last sentence of each paragraph")
+        self.assertEqual(events[-1][0], "done", "the stream should end with the final job state")
+
+    def test_unknown_job(self):
+        for url in ("/api/jobs/missing", "/api/jobs/missing/result", "/api/jobs/missing/events"):
+            with self.subTest(url):
+                self.assertEqual(self.client.get(url).status_code, 404, "unknown jobs should give 404")
+
+
+if __name__ == "__main__":
+    unittest.main()
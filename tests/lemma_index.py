@@ -0,0 +1,34 @@
+import random
+import unittest
+from lemma_index import LEMMA_POSITIONS, get_inflected_lexicon, verb_forms
+from lemma_table import lookup_lemma
+
+
+class TestInflectedLexicon(unittest.TestCase):
+    def setUp(self):
+        self.inflections = get_inflected_lexicon()
+
+    def test_entries_lemmatize_back(self):
+        for form in random.Random(0).sample(sorted(self.inflections), 300):
+            with self.subTest(form):
+                self.assertIn(self.inflections[form], [lookup_lemma(form, pos) for pos in LEMMA_POSITIONS],
+                              "the full mode lemmatizer should map the form onto its lexicon word")
+
+    def test_only_real_forms(self):
+        for form in ("abandones", "abhored", "abhoring", "abandoneder", "filths", "wines", "hurted"):
+            with self.subTest(form):
+                self.assertNotIn(form, self.inflections, "suffix rules should not produce non-words")
+        for form, word in (("abhorring", "abhor"), ("abandoning", "abandon"), ("scarred", "scar"),
+                           ("wept", "weep"), ("sadder", "sad"), ("canceled", "cancel")):
+            with self.subTest(form):
+                self.assertEqual(self.inflections.get(form), word, "real inflections should be listed")
+
+    def test_verb_forms(self):
+        self.assertEqual(verb_forms("scam"), {"s": "scams", "ed": "scammed", "ing": "scamming"},
+                         "one-syllable verbs should double their final consonant")
+        self.assertEqual(verb_forms("die"), {"s": "dies", "ed": "died", "ing": "dying"}, "-ie verbs take -ying")
+        self.assertEqual(verb_forms("hurt"), {"s": "hurts", "ing": "hurting"}, "unchanged past tenses have no -ed form")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import random
+import unittest
+from multiword_restore import (compile_phrase_matcher, fold_multiword_phrases, fold_multiword_phrases_compiled,
+                               convert_aliases_to_tuples, multiword_tuples, max_phrase_length)
+
+
+class TestPhraseMatcher(unittest.TestCase):
+    def setUp(self):
+        self.phrases = {("not", "good"): -2, ("not", "good", "at", "all"): -3, ("can't", "stand"): -3}
+        self.aliases = convert_aliases_to_tuples({"cannot stand": "can't stand", "not good": "no fun",
+                                                  "not bad": "not great"})
+        self.matcher = compile_phrase_matcher(self.phrases, 4, self.aliases)
+
+    def fold(self, tokens):
+        return fold_multiword_phrases_compiled(tokens, self.matcher)[0]
+
+    def test_longest_match_wins(self):
+        self.assertEqual(self.fold(["not", "good", "at", "all"]), ["not good at all"], "longest phrase should fold")
+        self.assertEqual(self.fold(["not", "good", "at"]), ["not good", "at"], "shorter phrase when longer one breaks off")
+
+    def test_alias_folds_to_canonical(self):
+        self.assertEqual(self.fold(["i", "cannot", "stand", "it"]), ["i", "can't stand", "it"], "alias should fold to canonical phrase")
+
+    def test_direct_phrase_beats_alias_and_unknown_canonical_is_ignored(self):
+        self.assertEqual(self.fold(["not", "good"]), ["not good"], "direct phrase should win over alias")
+        self.assertEqual(self.fold(["not", "bad"]), ["not", "bad"], "alias to unknown phrase should not fold")
+
+    def test_same_result_as_window_search(self):
+        matcher = compile_phrase_matcher(multiword_tuples, max_phrase_length, self.aliases)
+        words = sorted({word for phrase in multiword_tuples for word in phrase}) + ["cannot", "movie", "the"]
+        rng = random.Random(0)
+        for _ in range(2000):
+            tokens = [rng.choice(words) for _ in range(rng.randint(0, 12))]
+            self.assertEqual(fold_multiword_phrases_compiled(tokens, matcher),
+                             fold_multiword_phrases(tokens, multiword_tuples, max_phrase_length, self.aliases),
+                             f"compiled matcher differs on {tokens}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+import io
+import unittest
+from unittest import mock
+from bs4 import BeautifulSoup
+from afinn_loader import get_afinn
+from analysis import analyze_paragraphs
+from bounded_cache import BoundedCache
+import preprocessing
+from preprocessing import (iter_sentences, iter_paragraph_sentences, iter_paragraphs, sentence_splitting,
+                           remove_html_tags, strip_simple_tags, tokenize_sentences_cached, normalize_sentences,
+                           tokenize_normalized_sentences, PARAGRAPH_DELIMITER)
+from sentence_records import sentence_text
+from sentiment_analysis import get_sentence_score
+from upload_reader import iter_decoded_chunks, iter_upload_paragraphs
+
+
+class TestSentenceOffsets(unittest.TestCase):
+    texts = {
+        "surrounding whitespace": "  Great film.  Loved it!\t<br /><br />\n  The end was weak.   ",
+        "empty paragraphs": "<br /><br />First one. Second one?<br /><br />   <br /><br /><br /><br />Last one.<br /><br />",
+        "crlf": "Good acting.\r\nBad plot!\r\n<br /><br />\r\nWould not watch again.\r\n",
+        "no punctuation": "just words without a full stop<br /><br />and more words",
+    }
+
+    def assert_offsets(self, text, sentences):
+        for p, s, sentence, start in sentences:
+            self.assertEqual(text[start:start + len(sentence)], sentence,
+                             f"offset of paragraph {p} sentence {s} should point at the sentence")
+
+    def expected_sentences(self, text):
+        # Sentences as split before offsets were carried
+        return [(p, s, sentence)
+                for p, paragraph in enumerate(iter_paragraphs(text), 1)
+                for s, sentence in enumerate(sentence_splitting.split(paragraph), 1)]
+
+    def test_offsets_point_at_sentences(self):
+        for name, text in self.texts.items():
+            with self.subTest(name):
+                sentences = list(iter_sentences(text))
+                self.assert_offsets(text, sentences)
+                self.assertEqual([item[:3] for item in sentences], self.expected_sentences(text),
+                                 "numbering and sentences should match the split paragraphs")
+
+    def test_empty_paragraphs_are_not_numbered(self):
+        sentences = list(iter_sentences(self.texts["empty paragraphs"]))
+        self.assertEqual([(p, s) for p, s, _, _ in sentences], [(1, 1), (1, 2), (2, 1)],
+                         "empty paragraphs should be skipped")
+
+    def test_chunked_upload_offsets(self):
+        text = PARAGRAPH_DELIMITER.join(self.texts.values()) + "  Café crème was délicieux.  "
+        data = text.encode("utf-8")
+        for chunk_size in (1, 3, 7, 64):
+            with self.subTest(chunk_size=chunk_size):
+                paragraphs = iter_upload_paragraphs(iter_decoded_chunks(io.BytesIO(data), chunk_size=chunk_size))
+                sentences = list(iter_paragraph_sentences(paragraphs))
+                self.assert_offsets(text, sentences)
+                self.assertEqual(sentences, list(iter_sentences(text)),
+                                 "streamed paragraphs should give the same sentences and offsets")
+
+    def test_streamed_records_show_their_sentences(self):
+        text = self.texts["surrounding whitespace"] + PARAGRAPH_DELIMITER + self.texts["crlf"]
+        paragraphs = iter_upload_paragraphs(iter_decoded_chunks(io.BytesIO(text.encode("utf-8")), chunk_size=5))
+        content, records = analyze_paragraphs(paragraphs)
+        self.assertEqual(content, text, "joined paragraphs should give back the upload")
+        self.assertEqual([sentence_text(line, content) for line in records],
+                         [sentence for _, _, sentence in self.expected_sentences(text)],
+                         "each record should slice out its own sentence")
+
+
+class TestHtmlFastPath(unittest.TestCase):
+    simple = [
+        "plain text without markup",
+        "  \t ",
+        " \r\n ",
+        "Great film.<br /><br />Loved it!",
+        "<i>Really</i> <b>good</b>,<br/>  <br>\n<br />  watch it",
+        '<a href="http://example.com/?a=1" target=_blank>link</a> and <img src=\'x.png\' alt="x"/>',
+        "<p>\n</p><div>  </div><SPAN class=x>Mixed Case</SPAN>",
+        "<b>unclosed and </i>unopened",
+    ]
+    complex = [
+        "Tom &amp; Jerry",
+        "a <!-- hidden --> comment",
+        "3 < 5 and 6 > 4",
+        "<script>var x = 1;</script>visible",
+        "<pre>  kept   as is  </pre>",
+    ]
+
+    def soup_text(self, text):
+        return BeautifulSoup(text, "html.parser").get_text()
+
+    def test_fast_path_matches_parser(self):
+        for text in self.simple:
+            with self.subTest(text):
+                self.assertEqual(strip_simple_tags(text), self.soup_text(text),
+                                 "fast path should give the BeautifulSoup text")
+
+    def test_complex_markup_uses_parser(self):
+        for text in self.complex:
+            with self.subTest(text):
+                self.assertIsNone(strip_simple_tags(text), "markup the regex cannot vouch for should be refused")
+                self.assertEqual(remove_html_tags(text), self.soup_text(text),
+                                 "refused markup should still be stripped by BeautifulSoup")
+
+
+class TestLemmatizerModes(unittest.TestCase):
+    corpus = [
+        "What a wonderful, uplifting film.",
+        "The plot was boring and the acting was worse.",
+        "I hated every minute of it!",
+        "Their betrayals and the constant annoyances ruined it.",
+        "The broker called about the deal.",
+        "She cried and laughed at the loveliest scenes.",
+        "Nobody abhors a happy ending.",
+        "The anxieties of the cast were catastrophes waiting to happen.",
+        "Sadder still, the sequel got cancelled.",
+    ]
+
+    def scores(self, mode):
+        afinn = get_afinn()
+        return [get_sentence_score(afinn, tokens) for tokens in tokenize_sentences_cached(self.corpus, mode)]
+
+    def test_lexicon_mode_differences(self):
+        full, lexicon = self.scores("full"), self.scores("lexicon")
+        differences = {sentence: (full_score, lexicon_score)
+                       for sentence, full_score, lexicon_score in zip(self.corpus, full, lexicon)
+                       if full_score != lexicon_score}
+        # Plurals outside the unigram vocabulary are not in the lemma index, so only "full" scores their lemma
+        self.assertEqual(differences, {
+            "Their betrayals and the constant annoyances ruined it.": (-0.35, -0.1),
+            "The anxieties of the cast were catastrophes waiting to happen.": (-0.166666, 0.0),
+        }, "only noun plurals missing from the lemma index should score differently")
+
+
+class TestWordMemo(unittest.TestCase):
+    sentences = normalize_sentences([
+        "The actors were crying, the critics were crying and I cried too.",
+        "Sadder still, the better scenes were cut.",
+        "Worse acting, worse writing and the worst ending of the year.",
+    ])
+
+    def tokenize(self, memo):
+        with mock.patch.object(preprocessing, "word_memo", memo):
+            return tokenize_normalized_sentences(self.sentences, "full")
+
+    def test_memoized_tokens_match(self):
+        expected = self.tokenize(BoundedCache(0))
+        memo = BoundedCache(4)
+        for attempt in ("cold", "warm"):
+            with self.subTest(attempt):
+                self.assertEqual(self.tokenize(memo), expected, "memoized tokens should match the unmemoized path")
+        self.assertGreater(memo.hits, 0, "repeated words should be served from the memo")
+        self.assertGreater(memo.evictions, 0, "a full memo should evict its least recently used words")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+import tempfile
+import time
+import unittest
+from bounded_cache import BoundedCache
+from result_store import ResultStore, document_key
+from sentence_records import Document, Sentence
+
+
+class TestResultStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = ResultStore(self.tmp.name, memory_items=2, ttl_seconds=60)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_document_key_is_content_addressed(self):
+        self.assertEqual(document_key("a good movie"), document_key("a good movie"), "same text should give the same key")
+        self.assertNotEqual(document_key("a good movie"), document_key("a bad movie"), "different text should give different keys")
+
+    def test_put_and_get(self):
+        key = document_key("text")
+        result = {"content": "text", "sentences": []}
+        self.store.put(key, result)
+        self.assertEqual(self.store.get(key), result, "stored result should be returned")
+
+    def test_disk_tier_survives_new_store(self):
+        key = document_key("text")
+        self.store.put(key, {"content": "text"})
+        fresh_store = ResultStore(self.tmp.name, memory_items=2, ttl_seconds=60)
+        self.assertEqual(fresh_store.get(key), {"content": "text"}, "result should be loaded from disk")
+
+    def test_expired_entry_is_missing(self):
+        key = document_key("text")
+        self.store.put(key, {"content": "text"})
+        self.store.memory.clear()
+        old = time.time() - 120
+        os.utime(os.path.join(self.tmp.name, f"{key}.json"), (old, old))
+        self.assertIsNone(self.store.get(key), "expired result should not be returned")
+
+    def test_get_document(self):
+        key = document_key("Good. Bad.")
+        document = Document("Good. Bad.", [Sentence(1, 1, 0, 5, ["good"], 0.6), Sentence(1, 2, 6, 10, ["bad"], -0.6)])
+        self.store.put(key, document.to_dict())
+        self.assertEqual(self.store.get_document(key), document, "stored document should be rebuilt")
+
+    def test_document_without_offsets_is_missing(self):
+        key = document_key("Good.")
+        self.store.put(key, {"content": "Good.", "sentences": [{"para": 1, "sentence": 1, "original": "Good.",
+                                                                "tokens": ["good"], "score": 0.6}]})
+        self.assertIsNone(self.store.get_document(key), "results without span offsets should not be loaded")
+
+    def test_invalid_key(self):
+        self.assertIsNone(self.store.get("../app"), "non hex keys should be rejected")
+
+
+class TestBoundedCache(unittest.TestCase):
+    def test_least_recently_used_is_evicted(self):
+        cache = BoundedCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertNotIn("b", cache, "least recently used key should be evicted")
+        self.assertEqual(cache.stats()["evictions"], 1, "one eviction should be counted")
+
+
+if __name__ == "__main__":
+    unittest.main()
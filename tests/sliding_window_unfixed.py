@@ -0,0 +1,86 @@
+import random
+import unittest
+from scored_document import ScoredDocument
+from sentence_records import Sentence
+from sliding_window_unfixed import sliding_window_2
+
+
+def reference_segments(sentences, document):
+    # One sentence at a time as sliding_window_2 used to run, on whole tenths so nothing is rounded
+    found = []
+    for sign in (1, -1):
+        best, segments, temp, start, para = None, [], None, 0, None
+        for pos, line in enumerate(sentences):
+            if line.para != para:
+                para, temp = line.para, None
+            if not line.tokens:
+                continue
+            tenths = sign * round(line.score * 10)
+            if temp is None or temp < 0:
+                temp, start = tenths, pos
+            else:
+                temp += tenths
+            if best is None or temp > best:
+                best, segments = temp, [(start, pos)]
+            elif temp == best:
+                segments.append((start, pos))
+        found.append([{'sentence': " ".join(document[line.start:line.end] for line in sentences[start:end + 1]),
+                       'score': sign * best / 10}
+                      for start, end in segments])
+    return found
+
+
+def build_document(seed):
+    rng = random.Random(seed)
+    sentences, parts, offset = [], [], 0
+    for para in range(1, rng.randint(1, 4) + 1):
+        for number in range(1, rng.randint(1, 6) + 1):
+            text = f"Sentence {para}.{number}."
+            tokens = [] if rng.random() < 0.1 else ["word"]
+            score = rng.randint(-5, 5) / 10 if tokens else 0.0
+            sentences.append(Sentence(para, number, offset, offset + len(text), tokens, score))
+            parts.append(text)
+            offset += len(text) + 1
+    return sentences, " ".join(parts)
+
+
+class TestSlidingWindowUnfixed(unittest.TestCase):
+    def test_matches_sequential_reference(self):
+        for seed in range(300):
+            with self.subTest(seed=seed):
+                sentences, document = build_document(seed)
+                expected = reference_segments(sentences, document)
+                if not any(line.tokens for line in sentences):
+                    expected = "Unable to calculate sliding window"
+                self.assertEqual(sliding_window_2(ScoredDocument.from_sentences(sentences), document), expected,
+                                 "segments should match the one sentence at a time search")
+
+    def run_window(self, lines):
+        document = " ".join(text for text, _ in lines)
+        sentences = [Sentence(1, number, document.index(text), document.index(text) + len(text), ["word"], score)
+                     for number, (text, score) in enumerate(lines, 1)]
+        return sliding_window_2(ScoredDocument.from_sentences(sentences), document)
+
+    def test_zero_running_total_does_not_restart(self):
+        # The float loop summed 0.6 - 0.4 - 0.2 to -5.6e-17, restarted and gave
+        # [["I'm happy." 0.6, "We've won." 0.6], [... -0.6000000000000001]]
+        self.assertEqual(self.run_window([("I'm happy.", 0.6), ("You're sad?", -0.4),
+                                          ("He'll cry!", -0.2), ("We've won.", 0.6)]),
+                         [[{'sentence': "I'm happy.", 'score': 0.6},
+                           {'sentence': "I'm happy. You're sad? He'll cry! We've won.", 'score': 0.6}],
+                          [{'sentence': "You're sad? He'll cry!", 'score': -0.6}]],
+                         "a running total of exactly 0 should keep its segment going")
+
+    def test_scores_reported_on_the_step_grid(self):
+        # The float loop reported 0.30000000000000004 and -0.30000000000000004
+        self.assertEqual(self.run_window([("Good.", 0.1), ("Nice.", 0.2), ("Bad.", -0.1), ("Worse.", -0.2)]),
+                         [[{'sentence': "Good. Nice.", 'score': 0.3}], [{'sentence': "Bad. Worse.", 'score': -0.3}]],
+                         "segment scores should be whole steps without float noise")
+
+    def test_empty_document(self):
+        self.assertEqual(sliding_window_2(ScoredDocument.from_sentences([]), ""), "Unable to calculate sliding window",
+                         "no sentences should give the error message")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import io
+import unittest
+from preprocessing import PARAGRAPH_DELIMITER
+from upload_reader import iter_decoded_chunks, iter_upload_paragraphs, UploadTooLarge
+
+
+class TestDecodedChunks(unittest.TestCase):
+    text = "Café crème, 5€ and a 🎬 review.<br /><br />Naïve but fun."
+
+    def decode(self, data, chunk_size, max_bytes=1024):
+        return list(iter_decoded_chunks(io.BytesIO(data), max_bytes=max_bytes, chunk_size=chunk_size))
+
+    def test_characters_split_across_chunks(self):
+        # 2, 3 and 4 byte characters end up split at every possible position
+        data = self.text.encode("utf-8")
+        for chunk_size in range(1, 6):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual("".join(self.decode(data, chunk_size)), self.text,
+                                 "split characters should be decoded whole")
+
+    def test_truncated_character(self):
+        with self.assertRaises(UnicodeDecodeError):
+            self.decode("€".encode("utf-8")[:2], 1)
+
+    def test_upload_limit(self):
+        data = self.text.encode("utf-8")
+        self.assertEqual("".join(self.decode(data, 7, max_bytes=len(data))), self.text,
+                         "an upload of exactly max_bytes should be accepted")
+        with self.assertRaises(UploadTooLarge):
+            self.decode(data, 7, max_bytes=len(data) - 1)
+
+
+class TestUploadParagraphs(unittest.TestCase):
+    def test_delimiter_split_across_chunks(self):
+        text = "  First.<br /><br /><br /><br />Second one.<br /><br />"
+        for chunk_size in range(1, len(PARAGRAPH_DELIMITER) + 2):
+            with self.subTest(chunk_size=chunk_size):
+                chunks = [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+                self.assertEqual(list(iter_upload_paragraphs(chunks)), text.split(PARAGRAPH_DELIMITER),
+                                 "paragraphs should be the text split on the delimiter")
+
+
+if __name__ == "__main__":
+    unittest.main()
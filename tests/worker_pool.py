@@ -0,0 +1,70 @@
+import random
+import unittest
+from unittest import mock
+from preprocessing import complete_tokenization, iter_sentences, PARAGRAPH_DELIMITER
+import worker_pool
+from worker_pool import plan_shards, tokenize_in_shards
+
+
+def build_document(seed):
+    rng = random.Random(seed)
+    paragraphs = []
+    for para in range(rng.randint(1, 12)):
+        sentences = [f"Paragraph {para} has sentence {number}{'!' * rng.randint(0, 40)}."
+                     for number in range(rng.randint(1, 6))]
+        paragraphs.append(" ".join(sentences))
+    return PARAGRAPH_DELIMITER.join(paragraphs)
+
+
+class TestPlanShards(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(worker_pool, "PARALLEL_SHARD_CHARS", 100)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_shards_hold_whole_paragraphs(self):
+        for seed in range(200):
+            with self.subTest(seed=seed):
+                sentences = list(iter_sentences(build_document(seed)))
+                shards = plan_shards(sentences, workers=4)
+                self.assertLessEqual(len(shards), 4, "there should be no more shards than workers")
+                self.assertEqual([line for shard in shards for line in shard], sentences,
+                                 "the shards should be the sentences in document order")
+                paragraphs = [{para for para, _, _, _ in shard} for shard in shards]
+                for first, second in zip(paragraphs, paragraphs[1:]):
+                    self.assertFalse(first & second, "a paragraph should never be split between shards")
+
+    def test_small_document_is_one_shard(self):
+        sentences = list(iter_sentences("Short review.<br /><br />Still short."))
+        self.assertEqual(plan_shards(sentences, workers=4), [sentences], "small documents should not be split")
+        sentences = list(iter_sentences(build_document(3)))
+        self.assertEqual(plan_shards(sentences, workers=1), [sentences], "one worker should get one shard")
+
+
+class TestTokenizeInShards(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.patchers = [mock.patch.object(worker_pool, "PARALLEL_SHARD_CHARS", 100),
+                        mock.patch.object(worker_pool, "ANALYSIS_WORKERS", 2)]
+        for patcher in cls.patchers:
+            patcher.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        worker_pool.shutdown_process_pool()
+        for patcher in cls.patchers:
+            patcher.stop()
+
+    def test_matches_complete_tokenization(self):
+        text = PARAGRAPH_DELIMITER.join([
+            "What a great film. The ending was awful!",
+            "I would watch it again. The actors were crying.",
+            "Worse acting, worse writing. Nothing good to say.",
+        ] * 3)
+        self.assertGreater(len(plan_shards(list(iter_sentences(text)))), 1, "the text should be sharded")
+        self.assertEqual(tokenize_in_shards(text), complete_tokenization(text),
+                         "sharded tokenization should give the same records")
+
+
+if __name__ == "__main__":
+    unittest.main()
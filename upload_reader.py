@@ -0,0 +1,95 @@
+from typing import BinaryIO, Iterable, Iterator
+import codecs
+import os
+from preprocessing import PARAGRAPH_DELIMITER
+
+# Bytes read from the upload stream per step
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Largest accepted upload, in bytes
+MAX_UPLOAD_BYTES = int(os.environ.get("MAX_UPLOAD_BYTES", str(20 * 1024 * 1024)))
+
+
+class UploadTooLarge(ValueError):
+    """Raised when an upload exceeds the configured maximum size."""
+
+
+def iter_decoded_chunks(
+    stream: BinaryIO,
+    max_bytes: int = MAX_UPLOAD_BYTES,
+    chunk_size: int = UPLOAD_CHUNK_SIZE
+) -> Iterator[str]:
+    """
+    Read a binary stream in chunks and decode it as UTF-8 incrementally.
+
+    An incremental decoder keeps multi-byte characters that are split
+    across two chunks intact, so only one chunk of bytes is held at a time.
+
+    :param stream: Binary file-like object, e.g. an uploaded file's stream.
+    :type stream: BinaryIO
+
+    :param max_bytes: Maximum number of bytes accepted. Defaults to
+                      ``MAX_UPLOAD_BYTES``.
+    :type max_bytes: int, optional
+
+    :param chunk_size: Bytes read per step. Defaults to ``UPLOAD_CHUNK_SIZE``.
+    :type chunk_size: int, optional
+
+    :return: An iterator of decoded text chunks.
+    :rtype: Iterator[str]
+
+    :raises UploadTooLarge: If the stream is longer than ``max_bytes``.
+    :raises UnicodeDecodeError: If the stream is not valid UTF-8.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    total_bytes = 0
+
+    while True:
+        raw = stream.read(chunk_size)
+        if not raw:
+            break
+        total_bytes += len(raw)
+        if total_bytes > max_bytes:
+            raise UploadTooLarge(f"Upload exceeds {max_bytes} bytes")
+        text = decoder.decode(raw)
+        if text:
+            yield text
+
+    # Flush the decoder; raises if the stream ended mid-character
+    text = decoder.decode(b"", final=True)
+    if text:
+        yield text
+
+
+def iter_upload_paragraphs(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Split decoded text chunks into paragraphs as they arrive.
+
+    Paragraphs are separated by ``PARAGRAPH_DELIMITER``; a delimiter split
+    across two chunks is still recognised. Paragraphs are yielded exactly
+    as in the text (not stripped, empty ones included), so joining them
+    with the delimiter gives back the original text.
+
+    :param chunks: Decoded text chunks, e.g. from ``iter_decoded_chunks``.
+    :type chunks: Iterable[str]
+
+    :return: An iterator of raw paragraphs.
+    :rtype: Iterator[str]
+    """
+    buffer = ""
+    for chunk in chunks:
+        # Only the new chunk plus a possible partial delimiter needs searching
+        search_from = max(len(buffer) - len(PARAGRAPH_DELIMITER) + 1, 0)
+        buffer += chunk
+        start = 0
+        # Emit every paragraph whose closing delimiter has arrived
+        while True:
+            end = buffer.find(PARAGRAPH_DELIMITER, max(start, search_from))
+            if end == -1:
+                break
+            yield buffer[start:end]
+            start = end + len(PARAGRAPH_DELIMITER)
+        buffer = buffer[start:]
+
+    # Whatever is left is the last paragraph
+    yield buffer
@@ -0,0 +1,243 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby
+from typing import Callable, Iterable, Iterator, Optional
+import multiprocessing
+import os
+import threading
+from sentence_records import Sentence
+
+# Number of worker processes used for batch analysis
+ANALYSIS_WORKERS = int(os.environ.get("ANALYSIS_WORKERS", os.cpu_count() or 1))
+
+# Documents sent to a worker per task; larger chunks mean less IPC overhead,
+# smaller chunks balance uneven document sizes better
+ANALYSIS_CHUNK_SIZE = int(os.environ.get("ANALYSIS_CHUNK_SIZE", "8"))
+
+# Opt-in: tokenize the paragraphs of a single long document across the pool
+PARALLEL_TOKENIZATION = os.environ.get("PARALLEL_TOKENIZATION") == "1"
+
+# Characters of text each shard should at least hold; a document is split
+# into at most len(text) // PARALLEL_SHARD_CHARS shards, so anything shorter
+# than twice this stays on the serial path where IPC would cost more than it saves
+PARALLEL_SHARD_CHARS = int(os.environ.get("PARALLEL_SHARD_CHARS", "50000"))
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _warm_worker() -> None:
+    """
+    Initializer run once in every worker process.
+
+    Importing the pipeline and analysing a short text loads the AFINN
+    lexicon, alias map, stopwords, POS tagger and WordNet up front, so the
+    first real document sent to the worker does not pay for it.
+    """
+    from analysis import analyze_text
+    analyze_text("A good warm up sentence. Nothing bad here.", parallel=False)
+
+
+def _ready() -> bool:
+    # Trivial task used to force workers to start
+    return True
+
+
+def _analyze_document(text: str) -> dict:
+    """
+    Analyse one document inside a worker process.
+
+    :param text: Raw document text.
+    :type text: str
+
+    :return: The ``summarize`` output, or ``{"error": ...}`` if the
+             document could not be analysed.
+    :rtype: dict
+    """
+    from analysis import prepare_text, analyze_text, summarize
+    try:
+        text = prepare_text(text)
+        return summarize(analyze_text(text, parallel=False), text)
+    except Exception as e:
+        return {"error": f"{type(e).__name__}: {e}"}
+
+
+def _tokenize_shard(sentences: list[tuple[int, int, str, int]], alias_tsv_path: Optional[str]) -> list[list[str]]:
+    """
+    Tokenize a run of whole paragraphs inside a worker process.
+
+    :param sentences: ``(paragraph index, sentence index, sentence, start
+                      offset)`` tuples of complete paragraphs.
+    :type sentences: list[tuple[int, int, str, int]]
+
+    :param alias_tsv_path: Alias TSV file, see ``complete_tokenization``.
+    :type alias_tsv_path: str, optional
+
+    :return: The tokens of every sentence, in input order.
+    :rtype: list[list[str]]
+    """
+    from preprocessing import ensure_alias_map, iter_tokenized_sentences
+    ensure_alias_map(alias_tsv_path)
+    return [line.tokens for line in iter_tokenized_sentences(sentences)]
+
+
+def plan_shards(sentences: list[tuple[int, int, str, int]],
+                workers: Optional[int] = None) -> list[list[tuple[int, int, str, int]]]:
+    """
+    Split the sentences of a document into runs of whole paragraphs.
+
+    The number of shards adapts to the document: one per
+    ``PARALLEL_SHARD_CHARS`` characters, capped by the number of workers
+    and of paragraphs. Shards hold roughly equal amounts of text. A single
+    shard means the document is not worth sending to the pool.
+
+    :param sentences: ``(paragraph index, sentence index, sentence, start
+                      offset)`` tuples, e.g. from ``preprocessing.iter_sentences``.
+    :type sentences: list[tuple[int, int, str, int]]
+
+    :param workers: Number of workers to plan for. Defaults to
+                    ``ANALYSIS_WORKERS``.
+    :type workers: int, optional
+
+    :return: The shards, in document order.
+    :rtype: list[list[tuple[int, int, str, int]]]
+    """
+    paragraphs = [list(para) for _, para in groupby(sentences, key=lambda item: item[0])]
+    sizes = [sum(len(sentence) for _, _, sentence, _ in para) for para in paragraphs]
+    total_chars = sum(sizes)
+
+    shard_count = min(workers or ANALYSIS_WORKERS, len(paragraphs), total_chars // PARALLEL_SHARD_CHARS)
+    if shard_count < 2:
+        return [sentences]
+
+    # Close a shard once it reaches its share of the text
+    shards, current, filled = [], [], 0
+    for para, size in zip(paragraphs, sizes):
+        current.extend(para)
+        filled += size
+        if filled * shard_count >= total_chars * (len(shards) + 1) and len(shards) < shard_count - 1:
+            shards.append(current)
+            current = []
+    if current:
+        shards.append(current)
+    return shards
+
+
+def tokenize_in_shards(
+    text: str,
+    alias_tsv_path: Optional[str] = "afinn_aliases.tsv",
+    progress: Optional[Callable[[int, int, Sentence], None]] = None
+) -> list[Sentence]:
+    """
+    Tokenize one document with its paragraphs spread across the process pool.
+
+    Paragraphs are independent until scoring, so the document is numbered
+    and split into sentences here, shards of whole paragraphs (see
+    ``plan_shards``) are tokenized by the workers, and the results are put
+    back together in order. Documents too small for more than one shard are
+    tokenized in this process with ``complete_tokenization``. The output is
+    the same either way.
+
+    :param text: The full input string to tokenize.
+    :type text: str
+
+    :param alias_tsv_path: Alias TSV file, see ``complete_tokenization``.
+    :type alias_tsv_path: str, optional
+
+    :param progress: Optional ``(processed, total, sentence)`` callback,
+                     called for every sentence of a shard once the shard
+                     is done.
+    :type progress: Callable[[int, int, Sentence], None], optional
+
+    :return: Sentence records, see ``complete_tokenization``.
+    :rtype: list[Sentence]
+    """
+    from preprocessing import complete_tokenization, iter_sentences
+
+    sentences = list(iter_sentences(text))
+    shards = plan_shards(sentences)
+    if len(shards) < 2:
+        return complete_tokenization(text, alias_tsv_path=alias_tsv_path, progress=progress)
+
+    pool = get_process_pool()
+    results = pool.map(_tokenize_shard, shards, [alias_tsv_path] * len(shards))
+
+    hierarchical_tokens = []
+    for shard, token_lists in zip(shards, results):
+        for (p, s, sentence, start), tokens in zip(shard, token_lists):
+            hierarchical_tokens.append(Sentence(p, s, start, start + len(sentence), tokens))
+            if progress:
+                progress(len(hierarchical_tokens), len(sentences), hierarchical_tokens[-1])
+    return hierarchical_tokens
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    Return the shared process pool, creating it on first use.
+
+    Workers are started with the ``spawn`` method so they do not inherit
+    the Flask server's threads and locks, and each one runs
+    ``_warm_worker`` before accepting work.
+
+    :return: The shared executor.
+    :rtype: ProcessPoolExecutor
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=ANALYSIS_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_worker,
+            )
+        return _pool
+
+
+def start_process_pool() -> None:
+    """
+    Create the pool and wait until every worker has started and warmed up.
+
+    Meant to be called at application startup so the first batch request
+    does not wait for process creation and model loading.
+
+    :return: None
+    :rtype: None
+    """
+    pool = get_process_pool()
+    for future in [pool.submit(_ready) for _ in range(ANALYSIS_WORKERS)]:
+        future.result()
+
+
+def shutdown_process_pool() -> None:
+    """
+    Stop the shared pool; the next ``get_process_pool`` call creates a new one.
+
+    :return: None
+    :rtype: None
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(cancel_futures=True)
+            _pool = None
+
+
+def analyze_documents(texts: Iterable[str], chunk_size: Optional[int] = None) -> Iterator[dict]:
+    """
+    Analyse many documents across the process pool.
+
+    Documents are sent to the workers in chunks of ``chunk_size`` and the
+    summaries are yielded in input order as soon as they are available.
+
+    :param texts: Document texts to analyse.
+    :type texts: Iterable[str]
+
+    :param chunk_size: Documents per worker task. Defaults to
+                       ``ANALYSIS_CHUNK_SIZE``.
+    :type chunk_size: int, optional
+
+    :return: An iterator of ``summarize`` outputs (or ``{"error": ...}``),
+             one per input document, in input order.
+    :rtype: Iterator[dict]
+    """
+    pool = get_process_pool()
+    return pool.map(_analyze_document, texts, chunksize=chunk_size or ANALYSIS_CHUNK_SIZE)